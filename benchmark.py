@@ -0,0 +1,64 @@
+import argparse
+import time
+import tracemalloc
+
+from coindetector import http_client, pipeline
+from coindetector.replay import MockAPIServer, use_server
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Kaydedilmiş fixture'lar üzerinden uçtan uca benchmark")
+    parser.add_argument("--fixtures", default="fixtures",
+                        help="kayıt modunda (record_dir) mum deposu ve sembol indeksi kapalıyken oluşturulan klasör")
+    parser.add_argument("--coins", type=int, default=50, help="top_count")
+    parser.add_argument("--latency", type=float, default=0.05, help="sunucu tarafı istek gecikmesi (saniye)")
+    parser.add_argument("--server-per-second", type=int, default=None, help="sunucu hız sınırı (saniye)")
+    parser.add_argument("--server-per-minute", type=int, default=None, help="sunucu hız sınırı (dakika)")
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--rate-per-second", type=int, default=None, help="istemci tarafı kota, varsayılan sınırsız")
+    parser.add_argument("--rate-per-minute", type=int, default=None)
+    parser.add_argument("--no-batch", action="store_true", help="metrikleri coin coin hesapla")
+    parser.add_argument("--trace-memory", action="store_true", help="tracemalloc ile Python bellek zirvesini ölç")
+    args = parser.parse_args()
+
+    server = MockAPIServer(args.fixtures, args.latency, args.server_per_second, args.server_per_minute)
+    use_server(server.start())
+    # Ölçümler tekrarlanabilir olsun: disk önbelleği, yerel mum deposu ve sembol indeksi kullanılmaz
+    http_client.cache_dir = None
+
+    if args.trace_memory:
+        tracemalloc.start()
+    start = time.perf_counter()
+    results = pipeline.run(
+        [],
+        top_count=args.coins,
+        store_path=None,
+        index_path=None,
+        concurrency=args.concurrency,
+        rate_per_second=args.rate_per_second,
+        rate_per_minute=args.rate_per_minute,
+        batch_mode=not args.no_batch,
+        progress=False
+    )
+    elapsed = time.perf_counter() - start
+    traced_peak = tracemalloc.get_traced_memory()[1] if args.trace_memory else None
+    server.stop()
+
+    print(f"coins screened:   {len(results)} (top_count={args.coins})")
+    print(f"wall time:        {elapsed:.3f} s")
+    print(f"requests:         {server.request_count} ({server.rejected_count} rate limited)")
+    print(f"bytes downloaded: {server.bytes_sent}")
+    if traced_peak is not None:
+        print(f"peak traced mem:  {traced_peak / 1024 / 1024:.1f} MiB")
+    if resource is not None:
+        # Linux'ta KiB, macOS'ta bayt
+        print(f"peak RSS:         {resource.getrusage(resource.RUSAGE_SELF).ru_maxrss}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,39 @@
+import io
+import os
+import tempfile
+from contextlib import redirect_stdout
+
+from coindetector.sinks import ConsoleSink, CsvSink, XlsxSink, color_if_over_100
+
+from benchmarks import synthetic
+
+
+class Rendering:
+    def setup(self):
+        self.results = synthetic.make_results()
+        self.values = [r.potential for r in self.results] + [r.change_2y for r in self.results]
+
+    def time_color_if_over_100(self):
+        for value in self.values:
+            color_if_over_100(value)
+
+    def time_tabulate_console(self):
+        with redirect_stdout(io.StringIO()):
+            ConsoleSink(monthly=True).write(self.results)
+
+
+class Export:
+    def setup(self):
+        self.results = synthetic.make_results()
+        self.tmpdir = tempfile.mkdtemp()
+
+    def teardown(self):
+        for name in os.listdir(self.tmpdir):
+            os.remove(os.path.join(self.tmpdir, name))
+        os.rmdir(self.tmpdir)
+
+    def time_xlsx_export(self):
+        XlsxSink(os.path.join(self.tmpdir, "results.xlsx"), monthly=True, open_file=False).write(self.results)
+
+    def time_csv_export(self):
+        CsvSink(os.path.join(self.tmpdir, "results.csv"), monthly=True).write(self.results)
@@ -0,0 +1,49 @@
+from coindetector import pipeline
+from coindetector.batch_indicators import BatchMetrics
+
+from benchmarks import synthetic
+
+
+class PerCoinIndicators:
+    def setup(self):
+        self.histories = synthetic.make_histories()
+
+    def time_1m_buy_sell_ratio(self):
+        for history in self.histories:
+            pipeline.get_1m_buy_sell_ratio(history)
+
+    def time_6_months_data(self):
+        for history in self.histories:
+            pipeline.get_6_months_data(history)
+
+
+class BatchIndicators:
+    def setup(self):
+        self.windows = [h.window(730) for h in synthetic.make_histories()]
+
+    def time_batch_metrics(self):
+        BatchMetrics(self.windows)
+
+
+class ScreenFromHttp:
+    # HTTP yanıtı -> CoinHistory -> metrikler zinciri, sentetik histoday yanıtlarıyla
+    def setup(self):
+        synthetic.inject_http()
+        self.coins = synthetic.make_coins()
+
+    def time_screen(self):
+        pipeline.screen(self.coins, concurrency=1)
+
+
+class HistoryAppend:
+    # İzleme modundaki gibi her coine yeni bir günlük mum eklenir, en eski gün düşer
+    def setup(self):
+        self.histories = synthetic.make_histories()
+        self.day = synthetic.END_DAY
+
+    def time_apply_candle(self):
+        self.day += 1
+        candle = {"time": self.day * synthetic.DAY, "open": 1.0, "high": 1.0, "low": 1.0, "close": 1.0,
+                  "volumefrom": 1.0, "volumeto": 1.0}
+        for history in self.histories:
+            history.apply_candle(candle)
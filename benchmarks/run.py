@@ -0,0 +1,108 @@
+import argparse
+import importlib
+import inspect
+import json
+import os
+import pkgutil
+import statistics
+import subprocess
+import time
+from datetime import datetime, timezone
+
+from benchmarks import synthetic
+
+RESULTS_FILE = os.path.join(os.path.dirname(__file__), "results.jsonl")
+
+
+def discover(pattern=None):
+    # benchmarks/bench_*.py içindeki sınıfların time_* metotları (asv ile aynı adlandırma)
+    package_dir = os.path.dirname(__file__)
+    for info in sorted(pkgutil.iter_modules([package_dir]), key=lambda m: m.name):
+        if not info.name.startswith("bench_"):
+            continue
+        module = importlib.import_module("benchmarks." + info.name)
+        for cls_name, cls in inspect.getmembers(module, inspect.isclass):
+            if cls.__module__ != module.__name__:
+                continue
+            methods = [name for name in dir(cls) if name.startswith("time_")]
+            names = [f"{info.name}.{cls_name}.{m}" for m in methods]
+            selected = [(n, m) for n, m in zip(names, methods) if not pattern or pattern in n]
+            if selected:
+                yield cls, selected
+
+
+def run_class(cls, selected, repeat):
+    instance = cls()
+    if hasattr(instance, "setup"):
+        instance.setup()
+    try:
+        for full_name, method in selected:
+            times = []
+            for _ in range(repeat):
+                start = time.perf_counter()
+                getattr(instance, method)()
+                times.append(time.perf_counter() - start)
+            yield full_name, {"min": min(times), "median": statistics.median(times)}
+    finally:
+        if hasattr(instance, "teardown"):
+            instance.teardown()
+
+
+def git_commit():
+    try:
+        return subprocess.check_output(["git", "rev-parse", "--short", "HEAD"], stderr=subprocess.DEVNULL,
+                                       text=True).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def load_previous():
+    if not os.path.exists(RESULTS_FILE):
+        return None
+    with open(RESULTS_FILE, encoding="utf-8") as f:
+        lines = [line for line in f if line.strip()]
+    return json.loads(lines[-1]) if lines else None
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Hesaplama ve çıktı aşamaları için mikro benchmark'lar")
+    parser.add_argument("-k", dest="pattern", default=None, help="sadece adında bu metin geçenleri çalıştır")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--threshold", type=float, default=0.2, help="önceki çalıştırmaya göre gerileme eşiği")
+    parser.add_argument("--no-save", action="store_true", help="sonuçları results.jsonl'e ekleme")
+    args = parser.parse_args()
+
+    previous = load_previous()
+    previous_results = previous["results"] if previous else {}
+
+    results = {}
+    regressions = []
+    for cls, selected in discover(args.pattern):
+        for name, timing in run_class(cls, selected, args.repeat):
+            results[name] = timing
+            line = f"{name:<60} min {timing['min']:9.4f} s   median {timing['median']:9.4f} s"
+            before = previous_results.get(name)
+            if before:
+                change = timing["median"] / before["median"] - 1
+                line += f"   {change:+.1%}"
+                if change > args.threshold:
+                    regressions.append(name)
+            print(line, flush=True)
+
+    if not args.no_save:
+        with open(RESULTS_FILE, "a", encoding="utf-8") as f:
+            f.write(json.dumps({
+                "date": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+                "commit": git_commit(),
+                "sizes": {"coins": synthetic.COINS, "days": synthetic.DAYS, "rows": synthetic.ROWS,
+                          "screen_coins": synthetic.SCREEN_COINS},
+                "results": results
+            }) + "\n")
+
+    if regressions:
+        print("Regressions (> %{:.0f}): {}".format(args.threshold * 100, ", ".join(regressions)))
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+import os
+import random
+import zlib
+from datetime import datetime
+
+import numpy as np
+
+from coindetector import pipeline
+from coindetector.daily_ring import DailyRing
+from coindetector.ohlcv_store import DAY
+from coindetector.records import ScreenedCoin
+
+# Boyutlar ortam değişkenleriyle küçültülüp büyütülebilir
+COINS = int(os.environ.get("BENCH_COINS", 5000))
+DAYS = int(os.environ.get("BENCH_DAYS", 2000))
+ROWS = int(os.environ.get("BENCH_ROWS", 5000))
+SCREEN_COINS = int(os.environ.get("BENCH_SCREEN_COINS", 200))
+SEED = 1234
+
+END_DAY = 20000  # 2024-10-04, ölçümler tarihten bağımsız olsun diye sabit
+
+
+def make_arrays(n_days, rng):
+    # Rastgele yürüyüş fiyatları; yatay günler de olsun diye bir kısmı open == close
+    closes = np.cumprod(1 + rng.normal(0, 0.03, n_days)) * rng.uniform(0.01, 10)
+    opens = np.concatenate(([closes[0]], closes[:-1]))
+    flat = rng.random(n_days) < 0.05
+    closes[flat] = opens[flat]
+    days = np.arange(END_DAY - n_days + 1, END_DAY + 1).astype("datetime64[D]")
+    return days, opens, closes
+
+
+def make_history(symbol, n_days, rng):
+    # HTTP'ye gitmeden, sadece NumPy dizileriyle CoinHistory (liste/sözlük satırları oluşturulmaz)
+    days, opens, closes = make_arrays(n_days, rng)
+    return pipeline.CoinHistory.from_ring(symbol, "USD", DailyRing.from_arrays(days, open=opens, close=closes))
+
+
+def make_histories(n_coins=COINS, n_days=DAYS, seed=SEED):
+    rng = np.random.default_rng(seed)
+    return [make_history(f"S{i}", n_days, rng) for i in range(n_coins)]
+
+
+def histoday_payload(fsym, limit):
+    rng = np.random.default_rng(zlib.crc32(fsym.encode("utf-8")))
+    days, opens, closes = make_arrays(limit + 1, rng)
+    times = days.astype(np.int64) * DAY
+    rows = [{"time": t, "open": o, "high": max(o, c), "low": min(o, c), "close": c,
+             "volumefrom": 1.0, "volumeto": c}
+            for t, o, c in zip(times.tolist(), opens.tolist(), closes.tolist())]
+    return {"Response": "Success", "Data": {"Data": rows}}
+
+
+def fake_get_json(url, params=None, **kwargs):
+    # HTTP katmanının yerine geçer
+    if url.endswith("/histoday"):
+        return histoday_payload(params["fsym"], int(params["limit"]))
+    raise ValueError("no synthetic data for " + url)
+
+
+def inject_http():
+    pipeline.get_json = fake_get_json
+
+
+def make_coins(n=SCREEN_COINS, seed=SEED):
+    rnd = random.Random(seed)
+    return [{
+        "id": f"s{i}",
+        "name": f"Synthetic {i}",
+        "symbol": f"S{i}",
+        "price": rnd.uniform(0.01, 10),
+        "market_cap": rnd.uniform(1e9, 1e11),
+        "volume_24h": rnd.uniform(5e7, 5e9)
+    } for i in range(n)]
+
+
+def make_results(n=ROWS, seed=SEED):
+    rnd = random.Random(seed)
+    month_starts = [datetime(2024, m, 1) for m in range(5, 11)]
+    results = []
+    for i in range(n):
+        months = tuple((dt, b, 100 - b) for dt, b in ((dt, rnd.uniform(20, 80)) for dt in month_starts))
+        buy = rnd.uniform(20, 80)
+        results.append(ScreenedCoin(
+            f"Synthetic {i}", f"S{i}", rnd.uniform(0.01, 10), rnd.uniform(1e9, 1e11), rnd.uniform(5e7, 5e9),
+            rnd.uniform(0, 200), rnd.uniform(0, 300), buy, 100 - buy, rnd.uniform(-90, 900),
+            months=months, uptrend=rnd.random() < 0.3
+        ))
+    return results
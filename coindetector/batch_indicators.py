@@ -0,0 +1,118 @@
+from datetime import datetime
+
+import numpy as np
+
+from .indicators import day_directions
+
+CHANGE_DAYS = 731  # histoday limit=730
+RATIO_DAYS = 31  # histoday limit=30
+MONTHLY_DAYS = 181  # histoday limit=180
+MONTH_COUNT = 6
+
+
+def align(arrays, n_days=CHANGE_DAYS):
+    # Coinlerin (gün, açılış, kapanış) dizilerini ortak takvim ekseninde coin × gün matrislerine yerleştirir.
+    # Verisi olmayan günler (ör. yeni listelenen coinler) NaN kalır.
+    ends = [days[-1] for days, _, _ in arrays if len(days)]
+    end = max(ends) if ends else np.datetime64(0, "D")
+    axis = end - np.arange(n_days - 1, -1, -1)
+    opens = np.full((len(arrays), n_days), np.nan)
+    closes = np.full((len(arrays), n_days), np.nan)
+    for i, (days, o, c) in enumerate(arrays):
+        idx = (days - axis[0]).astype(np.int64)
+        keep = (idx >= 0) & (idx < n_days)
+        opens[i, idx[keep]] = o[keep]
+        closes[i, idx[keep]] = c[keep]
+    return axis, opens, closes
+
+
+def change_ratio(opens, closes):
+    # İlk ve son mevcut günün kapanışından yüzde değişim, tek günlük veya boş satırlar 0
+    valid = ~np.isnan(closes)
+    n_valid = valid.sum(axis=1)
+    first_idx = valid.argmax(axis=1)
+    last_idx = closes.shape[1] - 1 - valid[:, ::-1].argmax(axis=1)
+    rows = np.arange(closes.shape[0])
+    first = closes[rows, first_idx]
+    last = closes[rows, last_idx]
+    ok = (n_valid > 1) & (first > 0)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        change = ((last - first) / first) * 100
+    return np.where(ok, change, 0.0), ok
+
+
+def _ratios(up_n, down_n, flat_n):
+    buy_days = up_n + flat_n * 0.5
+    sell_days = down_n + flat_n * 0.5
+    total_days = buy_days + sell_days
+    with np.errstate(divide="ignore", invalid="ignore"):
+        buy_ratio = np.where(total_days > 0, (buy_days / total_days) * 100, 50.0)
+        sell_ratio = np.where(total_days > 0, (sell_days / total_days) * 100, 50.0)
+    return buy_ratio, sell_ratio, total_days > 0
+
+
+def buy_sell_ratio(opens, closes):
+    up, down, flat = day_directions(opens, closes)
+    return _ratios(up.sum(axis=1), down.sum(axis=1), flat.sum(axis=1))
+
+
+def monthly_ratios(axis, opens, closes, count=MONTH_COUNT):
+    # Her coin için verisi olan son `count` ayın oranları, sağa yaslı (eksik aylar solda NaN/NaT)
+    months = axis.astype("datetime64[M]")
+    starts = np.concatenate(([0], np.flatnonzero(months[1:] != months[:-1]) + 1))
+    up, down, flat = day_directions(opens, closes)
+    up_n = np.add.reduceat(up.astype(np.int64), starts, axis=1)
+    down_n = np.add.reduceat(down.astype(np.int64), starts, axis=1)
+    flat_n = np.add.reduceat(flat.astype(np.int64), starts, axis=1)
+    buy_ratio, sell_ratio, has_data = _ratios(up_n, down_n, flat_n)
+
+    # Sağdan sayarak verisi olan ayların sırası; son `count` tanesi sağa yaslanarak seçilir
+    rank = np.cumsum(has_data[:, ::-1], axis=1)[:, ::-1]
+    rows, cols = np.nonzero(has_data & (rank <= count))
+    slots = count - rank[rows, cols]
+
+    shape = (opens.shape[0], count)
+    out_months = np.full(shape, np.datetime64("NaT"), dtype="datetime64[M]")
+    out_buy = np.full(shape, np.nan)
+    out_sell = np.full(shape, np.nan)
+    out_months[rows, slots] = months[starts][cols]
+    out_buy[rows, slots] = buy_ratio[rows, cols]
+    out_sell[rows, slots] = sell_ratio[rows, cols]
+    return out_months, out_buy, out_sell
+
+
+class BatchMetrics:
+    # Tüm coinlerin metrikleri tek seferde dizi işlemleriyle hesaplanır
+    def __init__(self, arrays, monthly=True):
+        axis, opens, closes = align(arrays, CHANGE_DAYS)
+        self.change_2y, self.has_change = change_ratio(opens, closes)
+        self.buy_1m, self.sell_1m, self.has_1m = buy_sell_ratio(opens[:, -RATIO_DAYS:], closes[:, -RATIO_DAYS:])
+        self.months = self.month_buy = self.month_sell = self.uptrend = None
+        if monthly:
+            self.months, self.month_buy, self.month_sell = monthly_ratios(
+                axis[-MONTHLY_DAYS:], opens[:, -MONTHLY_DAYS:], closes[:, -MONTHLY_DAYS:]
+            )
+            full = ~np.isnat(self.months).any(axis=1)
+            self.uptrend = full & ((self.month_buy > self.month_sell).sum(axis=1) >= 4)
+
+    def change(self, i):
+        # Hesaplanamıyorsa get_2y_change gibi 0
+        if not self.has_change[i]:
+            return 0
+        return self.change_2y[i].item()
+
+    def ratio_1m(self, i):
+        # Veri yoksa get_1m_buy_sell_ratio gibi 50, 50
+        if not self.has_1m[i]:
+            return 50, 50
+        return self.buy_1m[i].item(), self.sell_1m[i].item()
+
+    def last_6(self, i):
+        # get_6_months_data ile aynı format: [(datetime, month_name, buy_ratio, sell_ratio), ...]
+        results = []
+        for month, br, sr in zip(self.months[i].tolist(), self.month_buy[i].tolist(), self.month_sell[i].tolist()):
+            if month is None:
+                continue
+            dt = datetime(month.year, month.month, 1)
+            results.append((dt, dt.strftime("%B"), br, sr))
+        return results
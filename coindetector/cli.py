@@ -0,0 +1,138 @@
+import argparse
+import sys
+
+from .screening import FIELDS
+
+# Ağır modüller (requests, numpy, tabulate, openpyxl, pyarrow, tqdm) burada değil, seçilen komut ve çıktılar
+# çalışırken yüklenir; böylece --help ve önbellekten dönen kısa çalıştırmalar hızlı başlar.
+
+OUTPUTS = ["console", "stream", "csv", "xlsx", "arrow", "parquet"]
+RANK_FIELDS = ["potential", "popularity", "change_2y", "buy_ratio_1m", "sell_ratio_1m", "market_cap", "volume_24h"]
+
+
+def common_options():
+    parser = argparse.ArgumentParser(add_help=False)
+    parser.add_argument("-n", "--top", type=int, default=50, help="ilk kaç coin taranır (0 = hepsi)")
+    parser.add_argument("--max-price", type=float, default=10.0, help="bu fiyatın altındaki coinler taranır")
+    parser.add_argument("--market-cap-min", type=float, default=1e9, help="en düşük piyasa değeri")
+    parser.add_argument("--volume-min", type=float, default=5e7, help="en düşük 24 saatlik hacim")
+    parser.add_argument("--currency", default="USD", help="karşı para birimi, ör. USD, EUR")
+    parser.add_argument("--store", default="ohlcv.db", help="günlük mumların saklandığı SQLite dosyası")
+    parser.add_argument("--no-store", action="store_true", help="yerel depo kullanma, geçmişin tamamını indir")
+    parser.add_argument("--no-cache", action="store_true", help="disk yanıt önbelleğini kullanma")
+    parser.add_argument("--concurrency", type=int, default=8, help="aynı anda yapılacak CryptoCompare isteği")
+    parser.add_argument("--rate-per-second", type=int, default=20, help="CryptoCompare saniyelik kota")
+    parser.add_argument("--rate-per-minute", type=int, default=300, help="CryptoCompare dakikalık kota")
+    parser.add_argument("--no-batch", action="store_true", help="metrikleri coin coin hesapla")
+    parser.add_argument("--index", default="symbol_index.json", help="CoinGecko -> CryptoCompare sembol indeksi")
+    parser.add_argument("--no-index", action="store_true", help="sembolleri eşlemeden olduğu gibi kullan")
+    parser.add_argument("--overrides", default="symbol_overrides.json", help="elle sembol eşlemeleri (JSON)")
+    return parser
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="coindetector", description="Güvenilir ve ucuz coinleri tara")
+    commands = parser.add_subparsers(dest="command", metavar="command")
+    common = common_options()
+
+    run_parser = commands.add_parser("run", parents=[common], help="bir kez tara ve çıktılara yaz")
+    run_parser.add_argument("-o", "--output", action="append", choices=OUTPUTS,
+                            help="çıktı, birden fazla verilebilir (varsayılan: console)")
+    run_parser.add_argument("--screen", metavar="SPEC",
+                            help='tarama ifadesi, ör. "price < 10 and potential > 20 order by potential desc limit 20" '
+                                 '(verilirse --max-price yerine kullanılır)')
+    run_parser.add_argument("--rank-by", metavar="FIELD", choices=RANK_FIELDS,
+                            help="tüm piyasadan bu alanda en yüksek -n coini seç (piyasa değeri sırası yerine)")
+    run_parser.add_argument("--monthly", action="store_true", help="son 6 ayın oranlarını ve trendi ekle")
+    run_parser.add_argument("--csv-path", default="results.csv")
+    run_parser.add_argument("--xlsx-path", default="results.xlsx")
+    run_parser.add_argument("--open", action="store_true", help="Excel dosyasını yazdıktan sonra aç")
+    run_parser.add_argument("--snapshots", default="snapshots", help="arrow / parquet çıktılarının klasörü")
+    run_parser.add_argument("--no-color", action="store_true")
+    run_parser.add_argument("--no-summary", action="store_true", help="stream çıktısında sonda sıralı tablo basma")
+    run_parser.add_argument("--sort-by", metavar="FIELD", choices=sorted(FIELDS),
+                            help="stream özet tablosunu bu alana göre büyükten küçüğe sırala")
+    run_parser.add_argument("--no-progress", action="store_true", help="ilerleme çubuğunu gösterme (cron)")
+    run_parser.add_argument("--workers", type=int, default=0, help="metrikleri bu kadar süreçle hesapla")
+    run_parser.add_argument("--record", metavar="DIR",
+                            help="API yanıtlarını fixture olarak kaydet (benchmark.py için --no-store --no-index ile)")
+    run_parser.add_argument("--metrics", metavar="PATH", help="ölçümleri JSON olarak yaz")
+    run_parser.add_argument("--prometheus", metavar="PATH", help="ölçümleri Prometheus textfile olarak yaz")
+    run_parser.add_argument("--profile", metavar="PATH", help="cProfile çıktısını yaz")
+    run_parser.set_defaults(func=cmd_run)
+
+    watch_parser = commands.add_parser("watch", parents=[common], help="belirli aralıklarla tara, değişenleri bildir")
+    watch_parser.add_argument("--interval", type=int, default=300, help="fiyat yenileme aralığı (saniye)")
+    watch_parser.add_argument("--market-interval", type=int, default=3600,
+                              help="piyasa listesi yenileme aralığı (saniye), 0 = her turda")
+    watch_parser.set_defaults(func=cmd_watch)
+    return parser
+
+
+def apply_common(args):
+    if args.no_cache:
+        from . import http_client
+        http_client.cache_dir = None
+    return {
+        "top_count": args.top or None,
+        "max_price": args.max_price,
+        "tsym": args.currency.upper(),
+        "store_path": None if args.no_store else args.store,
+        "concurrency": args.concurrency,
+        "rate_per_second": args.rate_per_second,
+        "rate_per_minute": args.rate_per_minute,
+        "batch_mode": not args.no_batch,
+        "market_cap_min": args.market_cap_min,
+        "volume_min": args.volume_min,
+        "index_path": None if args.no_index else args.index,
+        "overrides_path": args.overrides
+    }
+
+
+def cmd_run(args):
+    from .pipeline import run
+    from .sinks import make_sinks
+
+    options = {
+        "console": {"color": not args.no_color},
+        "stream": {"color": not args.no_color, "summary": not args.no_summary, "sort_by": args.sort_by},
+        "csv": {"path": args.csv_path},
+        "xlsx": {"path": args.xlsx_path, "open_file": args.open},
+        "arrow": {"root": args.snapshots},
+        "parquet": {"root": args.snapshots}
+    }
+    sinks = make_sinks(args.output or ["console"], monthly=args.monthly, options=options)
+    run(
+        sinks,
+        progress=not args.no_progress,
+        workers=args.workers,
+        record_dir=args.record,
+        metrics_path=args.metrics,
+        prometheus_path=args.prometheus,
+        profile_path=args.profile,
+        spec=args.screen,
+        rank_by=args.rank_by,
+        **apply_common(args)
+    )
+
+
+def cmd_watch(args):
+    from .sinks import ConsoleSink
+    from .watch import watch
+
+    watch([ConsoleSink(monthly=True)], interval=args.interval, market_interval=args.market_interval or None,
+          **apply_common(args))
+
+
+def main(argv=None):
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if args.command is None:
+        parser.print_help()
+        return 2
+    args.func(args)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
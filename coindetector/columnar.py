@@ -0,0 +1,148 @@
+import os
+import time
+from datetime import date, datetime, timezone
+
+import numpy as np
+
+from .ohlcv_store import COLUMNS, DAY
+
+try:
+    import pyarrow as pa
+    import pyarrow.dataset as ds
+    import pyarrow.fs as pafs
+    import pyarrow.parquet as pq
+except ImportError:  # isteğe bağlı bağımlılık: pip install pyarrow
+    pa = None
+
+FORMATS = {"arrow": ("ipc", ".arrow"), "parquet": ("parquet", ".parquet")}
+
+
+def require_pyarrow():
+    if pa is None:
+        raise ImportError("Columnar export requires pyarrow (pip install pyarrow)")
+
+
+def run_partition(now=None):
+    # Çıktılar çalıştırma gününe (UTC) göre hive tarzı klasörlere bölünür: run_date=YYYY-MM-DD
+    dt = datetime.fromtimestamp(time.time() if now is None else now, timezone.utc)
+    return f"run_date={dt:%Y-%m-%d}", f"{dt:%H%M%S}"
+
+
+def as_date(value):
+    return date.fromisoformat(value) if isinstance(value, str) else value
+
+
+def results_table(results):
+    require_pyarrow()
+    month_type = pa.list_(pa.struct([("month", pa.date32()), ("buy_ratio", pa.float64()),
+                                     ("sell_ratio", pa.float64())]))
+    return pa.table({
+        "name": pa.array([r.name for r in results], pa.string()),
+        "symbol": pa.array([r.symbol for r in results], pa.string()),
+        "price": pa.array([r.price for r in results], pa.float64()),
+        "market_cap": pa.array([r.market_cap for r in results], pa.float64()),
+        "volume_24h": pa.array([r.volume_24h for r in results], pa.float64()),
+        "potential": pa.array([r.potential for r in results], pa.float64()),
+        "popularity": pa.array([r.popularity for r in results], pa.float64()),
+        "buy_ratio_1m": pa.array([r.buy_ratio_1m for r in results], pa.float64()),
+        "sell_ratio_1m": pa.array([r.sell_ratio_1m for r in results], pa.float64()),
+        "change_2y": pa.array([r.change_2y for r in results], pa.float64()),
+        "months": pa.array([[{"month": dt.date(), "buy_ratio": br, "sell_ratio": sr} for dt, br, sr in r.months]
+                            for r in results], month_type),
+        "uptrend": pa.array([r.uptrend for r in results], pa.bool_())
+    })
+
+
+def history_table(histories):
+    # Coin başına günlük OHLCV satırları tek tabloda; sembol sütunu sözlük kodlamalı.
+    # Değer sütunları halka tamponun görünümlerinden doğrudan birleştirilir, satır sözlüğü oluşturulmaz.
+    require_pyarrow()
+    rings = [h.ring for h in histories]
+    sizes = [len(ring) for ring in rings]
+    symbols = [h.fsym for h in histories]
+    tsyms = [h.tsym for h in histories]
+    days = [ring.days() for ring in rings]
+    columns = {
+        "symbol": pa.array(np.repeat(np.array(symbols, dtype=object), sizes), pa.string()).dictionary_encode(),
+        "tsym": pa.array(np.repeat(np.array(tsyms, dtype=object), sizes), pa.string()).dictionary_encode(),
+        "time": pa.array(np.concatenate(days).astype(np.int64) * DAY if rings else np.array([], np.int64),
+                         pa.int64()).cast(pa.timestamp("s", tz="UTC"))
+    }
+    for col in COLUMNS[1:]:
+        values = [ring.column(col) for ring in rings]
+        values = np.concatenate(values).astype(np.float64, copy=False) if values else np.array([], np.float64)
+        columns[col] = pa.array(values, pa.float64(), from_pandas=True)
+    return pa.table(columns)
+
+
+def write_table(table, path, fmt="arrow"):
+    # Arrow IPC sıkıştırmasız yazılır, böylece memory-map ile kopyasız okunabilir
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp = path + ".tmp"
+    if fmt == "parquet":
+        pq.write_table(table, tmp)
+    else:
+        with pa.OSFile(tmp, "wb") as sink, pa.ipc.new_file(sink, table.schema) as writer:
+            writer.write_table(table)
+    os.replace(tmp, path)
+
+
+def read_snapshots(root="snapshots", kind="results", fmt="arrow", since=None, until=None, columns=None):
+    # root/<kind>/run_date=.../*.arrow dosyalarını tek tablo olarak okur; run_date sütunu klasör adından gelir.
+    # since / until (date veya "YYYY-MM-DD") sadece ilgili klasörlerin açılmasını sağlar.
+    # Arrow IPC dosyaları memory-map ile açılır, veri kopyalanmadan sayfalar gerektikçe diskten okunur.
+    require_pyarrow()
+    file_format = FORMATS[fmt][0]
+    path = os.path.join(root, kind)
+    if not os.path.isdir(path):
+        return None
+    dataset = ds.dataset(
+        path,
+        format=file_format,
+        partitioning=ds.partitioning(pa.schema([("run_date", pa.date32())]), flavor="hive"),
+        filesystem=pafs.LocalFileSystem(use_mmap=True),
+        exclude_invalid_files=True
+    )
+    run_date = ds.field("run_date")
+    condition = None
+    if since is not None:
+        condition = run_date >= as_date(since)
+    if until is not None:
+        condition = run_date <= as_date(until) if condition is None else condition & (run_date <= as_date(until))
+    return dataset.to_table(columns=columns, filter=condition)
+
+
+class ArrowSink:
+    # Sonuçları ve coin başına günlük OHLCV verisini çalıştırma gününe göre bölümlenmiş sütunlu dosyalara yazar:
+    # root/results/run_date=YYYY-MM-DD/results-HHMMSS.arrow ve root/ohlcv/run_date=YYYY-MM-DD/ohlcv-HHMMSS.arrow
+    fmt = "arrow"
+
+    def __init__(self, root="snapshots", monthly=False):
+        require_pyarrow()
+        self.root = root
+        self.monthly = monthly  # sütunlu çıktı her zaman aylık oranları içerir
+        self.partition, self.stamp = run_partition()
+        self.paths = []
+
+    def _path(self, kind):
+        suffix = FORMATS[self.fmt][1]
+        return os.path.join(self.root, kind, self.partition, f"{kind}-{self.stamp}{suffix}")
+
+    def write(self, results):
+        path = self._path("results")
+        write_table(results_table(results), path, self.fmt)
+        self.paths.append(path)
+
+    def write_histories(self, histories):
+        path = self._path("ohlcv")
+        write_table(history_table(histories), path, self.fmt)
+        self.paths.append(path)
+
+    def close(self):
+        for path in self.paths:
+            print(f"Data saved to {path}")
+
+
+class ParquetSink(ArrowSink):
+    # Parquet sıkıştırılmış ve başka araçlarla uyumludur, ancak okurken çözülmesi gerekir (kopyasız değil)
+    fmt = "parquet"
@@ -0,0 +1,109 @@
+import numpy as np
+
+from .ohlcv_store import COLUMNS, DAY
+
+VALUE_COLUMNS = COLUMNS[1:]  # open, high, low, close, volumefrom, volumeto
+
+
+class DailyRing:
+    # Bir coinin son `capacity` günlük mumu, sütun başına sabit boyutlu NumPy tamponunda.
+    # Satır başına zaman damgası tutulmaz: gün = first_day + sıra (UTC epoch günü).
+    # Her değer tamponda iki kez (i ve i + capacity) yazılır; böylece en eski günün düşürülmesi ve yeni gün
+    # eklenmesi O(1) olur, herhangi bir son-N-gün penceresi de kopyasız, bitişik bir görünümdür.
+    __slots__ = ("capacity", "columns", "index", "buffer", "start", "size", "first_day")
+
+    def __init__(self, capacity, columns=VALUE_COLUMNS, dtype=np.float64):
+        self.capacity = capacity
+        self.columns = tuple(columns)
+        self.index = {name: i for i, name in enumerate(self.columns)}
+        self.buffer = np.full((len(self.columns), 2 * capacity), np.nan, dtype=dtype)
+        self.start = 0
+        self.size = 0
+        self.first_day = None
+
+    @classmethod
+    def from_rows(cls, rows, capacity, dtype=np.float64):
+        # histoday / depo satırlarından; günler ardışıksa tek seferde sütun sütun kopyalanır
+        ring = cls(capacity, dtype=dtype)
+        rows = rows[-capacity:]
+        if not rows:
+            return ring
+        first_day = rows[0]["time"] // DAY
+        if rows[-1]["time"] // DAY - first_day != len(rows) - 1:
+            for row in rows:
+                ring.append(row["time"] // DAY, row)
+            return ring
+        n = len(rows)
+        for i, name in enumerate(ring.columns):
+            values = np.fromiter((row.get(name, np.nan) for row in rows), dtype=np.float64, count=n)
+            ring.buffer[i, :n] = values
+            ring.buffer[i, capacity:capacity + n] = values
+        ring.size = n
+        ring.first_day = first_day
+        return ring
+
+    @classmethod
+    def from_arrays(cls, days, capacity=None, dtype=np.float64, **columns):
+        # Ardışık günlük NumPy dizilerinden (ör. sentetik veri); verilmeyen sütunlar NaN kalır
+        capacity = capacity or len(days)
+        ring = cls(capacity, dtype=dtype)
+        n = min(len(days), capacity)
+        for name, values in columns.items():
+            i = ring.index[name]
+            ring.buffer[i, :n] = values[-n:]
+            ring.buffer[i, capacity:capacity + n] = values[-n:]
+        ring.size = n
+        ring.first_day = int(days[-n].astype(np.int64)) if n else None
+        return ring
+
+    def __len__(self):
+        return self.size
+
+    @property
+    def last_day(self):
+        return None if self.size == 0 else self.first_day + self.size - 1
+
+    def _write(self, slot, row):
+        for i, name in enumerate(self.columns):
+            value = row.get(name)
+            value = np.nan if value is None else value
+            self.buffer[i, slot] = value
+            self.buffer[i, slot + self.capacity] = value
+
+    def append(self, day, row):
+        # Aynı gün tekrar gelirse üzerine yazılır (bugünün yarım mumu), daha eski günler yok sayılır.
+        # Arada eksik gün varsa NaN satırlarla doldurulur.
+        if self.size:
+            last_day = self.last_day
+            if day < last_day:
+                return
+            if day == last_day:
+                self._write((self.start + self.size - 1) % self.capacity, row)
+                return
+            while last_day + 1 < day:
+                self._push({})
+                last_day += 1
+        else:
+            self.first_day = day
+        self._push(row)
+
+    def _push(self, row):
+        if self.size < self.capacity:
+            self._write((self.start + self.size) % self.capacity, row)
+            self.size += 1
+        else:
+            # Dolu: en eski günün yerine yazılır
+            self._write(self.start, row)
+            self.start = (self.start + 1) % self.capacity
+            self.first_day += 1
+
+    def days(self, count=None):
+        count = self.size if count is None else min(count, self.size)
+        first = self.first_day + self.size - count if self.size else 0
+        return np.arange(first, first + count, dtype=np.int64).astype("datetime64[D]")
+
+    def column(self, name, count=None):
+        # Son `count` günün kopyasız görünümü
+        count = self.size if count is None else min(count, self.size)
+        end = self.start + self.size
+        return self.buffer[self.index[name], end - count:end]
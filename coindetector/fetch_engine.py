@@ -0,0 +1,77 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, FIRST_EXCEPTION, wait
+
+# CryptoCompare ücretsiz anahtar kotaları (saniye / dakika başına istek)
+CRYPTOCOMPARE_PER_SECOND = 20
+CRYPTOCOMPARE_PER_MINUTE = 300
+
+
+class TokenBucket:
+    def __init__(self, capacity, period):
+        # period saniyede capacity kadar jeton dolar
+        self.capacity = capacity
+        self.period = period
+        self.tokens = capacity
+        self.updated = time.monotonic()
+
+    def refill(self, now):
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.capacity / self.period)
+        self.updated = now
+
+    def wait_time(self):
+        if self.tokens >= 1:
+            return 0
+        return (1 - self.tokens) * self.period / self.capacity
+
+
+class RateLimiter:
+    # Birden fazla kovayı (ör. saniyelik ve dakikalık kota) aynı anda uygular
+    def __init__(self, per_second=CRYPTOCOMPARE_PER_SECOND, per_minute=CRYPTOCOMPARE_PER_MINUTE):
+        self.buckets = []
+        if per_second:
+            self.buckets.append(TokenBucket(per_second, 1.0))
+        if per_minute:
+            self.buckets.append(TokenBucket(per_minute, 60.0))
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                for bucket in self.buckets:
+                    bucket.refill(now)
+                wait = max([bucket.wait_time() for bucket in self.buckets] + [0])
+                if wait == 0:
+                    for bucket in self.buckets:
+                        bucket.tokens -= 1
+                    return
+            time.sleep(wait)
+
+
+def fetch_all(items, fetch, concurrency=8, limiter=None, on_done=None):
+    # fetch(item) çağrılarını paralel yürütür, sonuçları items sırasıyla döner
+    def run(item):
+        if limiter is not None:
+            limiter.acquire()
+        return fetch(item)
+
+    def done(future):
+        # Hata veren ya da iptal edilen iş için geri çağrı yapılmaz; hata fetch_all'dan yükselir
+        if not future.cancelled() and future.exception() is None:
+            on_done(future.result())
+
+    with ThreadPoolExecutor(max_workers=max(1, concurrency)) as executor:
+        futures = [executor.submit(run, item) for item in items]
+        if on_done is not None:
+            for future in futures:
+                future.add_done_callback(done)
+        wait(futures, return_when=FIRST_EXCEPTION)
+        for future in futures:
+            if future.done() and not future.cancelled() and future.exception() is not None:
+                # İlk hatada kuyrukta bekleyen işler iptal edilir (shutdown(cancel_futures=True) ile aynı,
+                # Python 3.8'de de çalışır); yalnızca o an çalışanların bitmesi beklenir
+                for pending in futures:
+                    pending.cancel()
+                raise future.exception()
+        return [future.result() for future in futures]
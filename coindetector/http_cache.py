@@ -0,0 +1,145 @@
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+
+DAY = 86400
+DEFAULT_TTL = 60
+
+
+def next_utc_midnight(now):
+    return (int(now) // DAY + 1) * DAY
+
+
+def expires_at(url, now):
+    # Uç nokta bazında tazelik süresi
+    if "/coins/markets" in url:
+        # Piyasa listesi sık değişir
+        return now + 120
+    if "/histoday" in url:
+        # Günlük mumlar yeni UTC günü başlayana kadar geçerli
+        return next_utc_midnight(now)
+    if "/pricemultifull" in url:
+        return now + 30
+    return now + DEFAULT_TTL
+
+
+def is_cacheable(data):
+    # CryptoCompare hataları (ör. kota aşımı) HTTP 200 ile döner, bunlar saklanmaz
+    return not (isinstance(data, dict) and data.get("Response") == "Error")
+
+
+def cache_key(url, params):
+    raw = url + "?" + json.dumps(params or {}, sort_keys=True)
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+class CacheEntry:
+    __slots__ = ("body", "expires", "etag", "last_modified", "size")
+
+    def __init__(self, body, expires, etag=None, last_modified=None, size=0):
+        self.body = body
+        self.expires = expires
+        self.etag = etag
+        self.last_modified = last_modified
+        self.size = size  # Ham JSON boyutu (bayt), bellek sınırı için
+
+    def is_fresh(self, now):
+        return now < self.expires
+
+    def conditional_headers(self):
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class ResponseCache:
+    # Bellek (LRU) + disk (boyut sınırlı, en eski kullanılan önce silinir) yanıt önbelleği.
+    # Bellek katmanı kayıt sayısıyla değil ham JSON boyutuyla sınırlanır: 730 günlük bir histoday yanıtı
+    # ayrıştırılınca yüzlerce KiB tutar, sayı sınırı uzun yaşayan süreçlerde (watch) yüz MiB'leri bulur.
+    def __init__(self, directory=".http_cache", max_memory_bytes=8 * 1024 * 1024, max_disk_bytes=200 * 1024 * 1024):
+        self.directory = directory
+        self.max_memory_bytes = max_memory_bytes
+        self.max_disk_bytes = max_disk_bytes
+        self.memory = OrderedDict()
+        self.memory_bytes = 0
+        self.lock = threading.Lock()
+        self.disk_bytes = 0
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+            self.disk_bytes = sum(os.path.getsize(p) for p in self._disk_files())
+
+    def _path(self, key):
+        return os.path.join(self.directory, key + ".json")
+
+    def _disk_files(self):
+        return [os.path.join(self.directory, name) for name in os.listdir(self.directory) if name.endswith(".json")]
+
+    def get(self, key):
+        with self.lock:
+            entry = self.memory.get(key)
+            if entry is not None:
+                self.memory.move_to_end(key)
+                return entry
+            if not self.directory:
+                return None
+            path = self._path(key)
+            try:
+                with open(path, encoding="utf-8") as f:
+                    raw = json.load(f)
+                os.utime(path)  # LRU sırası için son kullanım zamanı
+                size = os.path.getsize(path)
+            except (OSError, ValueError):
+                return None
+            entry = CacheEntry(raw["body"], raw["expires"], raw.get("etag"), raw.get("last_modified"), size)
+            self._remember(key, entry)
+            return entry
+
+    def put(self, key, entry):
+        with self.lock:
+            self._remember(key, entry)
+            if not self.directory:
+                return
+            path = self._path(key)
+            old_size = os.path.getsize(path) if os.path.exists(path) else 0
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump({
+                    "body": entry.body,
+                    "expires": entry.expires,
+                    "etag": entry.etag,
+                    "last_modified": entry.last_modified
+                }, f)
+            self.disk_bytes += os.path.getsize(path) - old_size
+            if self.disk_bytes > self.max_disk_bytes:
+                self._evict_disk()
+
+    def _remember(self, key, entry):
+        old = self.memory.pop(key, None)
+        if old is not None:
+            self.memory_bytes -= old.size
+        if entry.size > self.max_memory_bytes:
+            # Sınırdan büyük yanıt bellekte tutulmaz, diskten okunur
+            return
+        self.memory[key] = entry
+        self.memory_bytes += entry.size
+        while self.memory_bytes > self.max_memory_bytes:
+            _, evicted = self.memory.popitem(last=False)
+            self.memory_bytes -= evicted.size
+
+    def _evict_disk(self):
+        # En uzun süredir kullanılmayan dosyalar, sınırın %90'ına inene kadar silinir
+        files = sorted(self._disk_files(), key=os.path.getmtime)
+        target = self.max_disk_bytes * 0.9
+        for path in files:
+            if self.disk_bytes <= target:
+                break
+            try:
+                size = os.path.getsize(path)
+                os.remove(path)
+            except OSError:
+                continue
+            self.disk_bytes -= size
@@ -0,0 +1,115 @@
+import threading
+import time
+from urllib.parse import urlsplit
+
+from .http_cache import ResponseCache, CacheEntry, cache_key, expires_at, is_cacheable
+from .metrics import METRICS
+
+TIMEOUT = (5, 30)  # (bağlantı, okuma) saniye
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+_session = None
+_session_lock = threading.Lock()
+_cache = None
+_cache_lock = threading.Lock()
+cache_dir = ".http_cache"  # None ise sadece bellek önbelleği kullanılır
+record_dir = None  # Ayarlanırsa her yanıt bu klasöre fixture olarak kaydedilir (bkz. replay.py)
+
+
+def get_session():
+    # Tüm API çağrıları tek bir oturumu paylaşır, böylece host başına bağlantılar açık kalır
+    # requests sadece ilk ağ isteğinde yüklenir; önbellekten dönen çalıştırmalar import maliyetini ödemez
+    global _session
+    with _session_lock:
+        if _session is None:
+            import requests
+            from requests.adapters import HTTPAdapter
+            from urllib3.util.retry import Retry
+            retry = Retry(
+                total=5,
+                backoff_factor=1,
+                status_forcelist=RETRY_STATUSES,
+                allowed_methods=frozenset(["GET"]),
+                respect_retry_after_header=True,
+                raise_on_status=False
+            )
+            adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=retry)
+            session = requests.Session()
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            session.headers["Accept-Encoding"] = "gzip, deflate"
+            _session = session
+        return _session
+
+
+def get_cache():
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            _cache = ResponseCache(cache_dir)
+        return _cache
+
+
+def get_json(url, params=None, timeout=TIMEOUT, use_cache=True, limiter=None):
+    # limiter (RateLimiter) sadece ağa gidilecekse jeton alır; taze önbellek yanıtları kotaya sayılmaz
+    data = _get_json(url, params, timeout, use_cache, limiter)
+    if record_dir:
+        from .replay import save_fixture
+        save_fixture(record_dir, url, params, data)
+    return data
+
+
+def endpoint_name(url):
+    # Metrik etiketi: "markets", "histoday" gibi yolun son parçası
+    return urlsplit(url).path.rstrip("/").rsplit("/", 1)[-1]
+
+
+def _record_response(endpoint, response, elapsed):
+    METRICS.observe("http_request_seconds", elapsed, endpoint=endpoint)
+    METRICS.inc("http_requests_total", endpoint=endpoint, status=response.status_code)
+    length = response.headers.get("Content-Length")
+    METRICS.inc("http_bytes_total", int(length) if length else len(response.content), endpoint=endpoint)
+    # urllib3'ün bu istek için yaptığı tekrar denemeler
+    retries = getattr(getattr(response, "raw", None), "retries", None)
+    history = getattr(retries, "history", None)
+    if history:
+        METRICS.inc("http_retries_total", len(history), endpoint=endpoint)
+
+
+def _get_json(url, params, timeout, use_cache, limiter):
+    endpoint = endpoint_name(url)
+    cache = get_cache() if use_cache else None
+    key = cache_key(url, params) if cache is not None else None
+    entry = cache.get(key) if cache is not None else None
+    now = time.time()
+    if entry is not None and entry.is_fresh(now):
+        METRICS.inc("http_cache_hits_total", endpoint=endpoint)
+        return entry.body
+    if cache is not None:
+        METRICS.inc("http_cache_misses_total", endpoint=endpoint)
+
+    # Süresi dolmuş kayıt varsa koşullu istek (ETag / Last-Modified) gönder
+    headers = entry.conditional_headers() if entry is not None else None
+    if limiter is not None:
+        limiter.acquire()
+    start = time.perf_counter()
+    response = get_session().get(url, params=params, headers=headers, timeout=timeout)
+    _record_response(endpoint, response, time.perf_counter() - start)
+    if response.status_code == 304 and entry is not None:
+        METRICS.inc("http_cache_revalidated_total", endpoint=endpoint)
+        entry.expires = expires_at(url, now)
+        cache.put(key, entry)
+        return entry.body
+
+    # Tekrar denemeler tükendiyse sessizce devam etme, hatayı yükselt
+    response.raise_for_status()
+    data = response.json()
+    if cache is not None and is_cacheable(data):
+        cache.put(key, CacheEntry(
+            data,
+            expires_at(url, now),
+            response.headers.get("ETag"),
+            response.headers.get("Last-Modified"),
+            len(response.content)
+        ))
+    return data
@@ -0,0 +1,78 @@
+from datetime import datetime
+
+import numpy as np
+
+
+def day_directions(opens, closes):
+    # Yükselen, düşen ve yatay günlerin maskeleri. Verisi olmayan (NaN, ör. halka tamponda eksik gün) günler
+    # hiçbirine girmez; coin başına ve toplu hesaplama aynı maskeleri kullanır.
+    valid = ~(np.isnan(opens) | np.isnan(closes))
+    up = closes > opens
+    down = closes < opens
+    flat = ~(up | down) & valid
+    return up, down, flat
+
+
+def buy_sell_ratio(opens, closes):
+    if len(closes) == 0:
+        return 50, 50
+    up, down, flat = day_directions(opens, closes)
+    half = int(np.count_nonzero(flat)) * 0.5
+    buy_days = int(np.count_nonzero(up)) + half
+    sell_days = int(np.count_nonzero(down)) + half
+    total_days = buy_days + sell_days
+    if total_days > 0:
+        return (buy_days / total_days) * 100, (sell_days / total_days) * 100
+    return 50, 50
+
+
+def monthly_ratios(days, opens, closes):
+    # Ay bazında buy/sell oranları: [(datetime, month_name, buy_ratio, sell_ratio), ...] tarihe göre sıralı
+    if len(days) == 0:
+        return []
+    order = np.argsort(days, kind="stable")
+    days, opens, closes = days[order], opens[order], closes[order]
+
+    months = days.astype("datetime64[M]")
+    starts = np.concatenate(([0], np.flatnonzero(months[1:] != months[:-1]) + 1))
+    up, down, flat = day_directions(opens, closes)
+    up_counts = np.add.reduceat(up.astype(np.int64), starts)
+    down_counts = np.add.reduceat(down.astype(np.int64), starts)
+    flat_counts = np.add.reduceat(flat.astype(np.int64), starts)
+
+    # Hiç verisi olmayan aylar atlanır (toplu hesaplamadaki gibi)
+    return [month_ratio(month.year, month.month, up_n, down_n, flat_n)
+            for month, up_n, down_n, flat_n in zip(months[starts].tolist(), up_counts.tolist(),
+                                                   down_counts.tolist(), flat_counts.tolist())
+            if up_n + down_n + flat_n > 0]
+
+
+def month_ratio(year, month, up_n, down_n, flat_n):
+    # Bir ayın yükselen/düşen/yatay gün sayılarından (datetime, month_name, buy_ratio, sell_ratio)
+    buy_days = up_n + flat_n * 0.5
+    sell_days = down_n + flat_n * 0.5
+    total_days = buy_days + sell_days
+    if total_days > 0:
+        buy_ratio = (buy_days / total_days) * 100
+        sell_ratio = (sell_days / total_days) * 100
+    else:
+        buy_ratio, sell_ratio = 50, 50
+    dt = datetime(year, month, 1)
+    return dt, dt.strftime("%B"), buy_ratio, sell_ratio
+
+
+def stored_months(counts, days, opens, closes):
+    # Depodaki ay sayaçları (OHLCVStore.month_counts) tam takvim aylarını kapsar, pencereye dayalı gruplama ise
+    # son 181 günü. Pencere ay ortasında başlıyor ve en eski ay sayaçlarda da varsa o ay sadece pencereden
+    # hesaplanır; böylece sonuç monthly_ratios(pencere)[-6:] ile aynı kalır.
+    ratios = [month_ratio(*c) for c in counts]
+    if not ratios or len(days) == 0:
+        return ratios
+    first_month = days[0].astype("datetime64[M]")
+    oldest = np.datetime64(ratios[0][0], "M")
+    if oldest == first_month and days[0] != first_month.astype("datetime64[D]"):
+        in_month = days < (first_month + 1).astype("datetime64[D]")
+        # Pencerede o aya ait veri yoksa ay pencere tabanlı gruplamada da yer almaz
+        ratios = monthly_ratios(days[in_month], opens[in_month], closes[in_month]) + ratios[1:]
+    return ratios
+
@@ -0,0 +1,142 @@
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+
+PREFIX = "coindetector_"
+DEFAULT_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+
+def _label_key(labels):
+    return tuple(sorted(labels.items()))
+
+
+def _label_text(label_key):
+    if not label_key:
+        return ""
+    return "{" + ",".join(f'{k}="{v}"' for k, v in label_key) + "}"
+
+
+class Histogram:
+    def __init__(self, buckets=DEFAULT_BUCKETS):
+        self.buckets = buckets
+        self.counts = [0] * len(buckets)
+        self.count = 0
+        self.sum = 0.0
+        self.min = None
+        self.max = None
+
+    def observe(self, value):
+        self.count += 1
+        self.sum += value
+        self.min = value if self.min is None else min(self.min, value)
+        self.max = value if self.max is None else max(self.max, value)
+        for i, bound in enumerate(self.buckets):
+            if value <= bound:
+                self.counts[i] += 1
+
+    def to_dict(self):
+        return {
+            "count": self.count,
+            "sum": self.sum,
+            "min": self.min,
+            "max": self.max,
+            "buckets": {str(bound): n for bound, n in zip(self.buckets, self.counts)}
+        }
+
+
+class Metrics:
+    # Çalıştırma boyunca sayaçlar ve gecikme histogramları; JSON ve Prometheus textfile olarak yazılır
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self.lock:
+            self.counters = {}  # (ad, etiketler) -> değer
+            self.histograms = {}  # (ad, etiketler) -> Histogram
+            self.stages = {}  # aşama -> toplam süre (saniye)
+
+    def inc(self, name, value=1, **labels):
+        key = (name, _label_key(labels))
+        with self.lock:
+            self.counters[key] = self.counters.get(key, 0) + value
+
+    def observe(self, name, value, **labels):
+        key = (name, _label_key(labels))
+        with self.lock:
+            histogram = self.histograms.get(key)
+            if histogram is None:
+                histogram = self.histograms[key] = Histogram()
+            histogram.observe(value)
+
+    @contextmanager
+    def timer(self, name, **labels):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, time.perf_counter() - start, **labels)
+
+    @contextmanager
+    def stage(self, stage):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            with self.lock:
+                self.stages[stage] = self.stages.get(stage, 0.0) + elapsed
+            self.observe("stage_seconds", elapsed, stage=stage)
+
+    def to_dict(self):
+        with self.lock:
+            return {
+                "stages": dict(self.stages),
+                "counters": {name + _label_text(labels): value
+                             for (name, labels), value in sorted(self.counters.items())},
+                "histograms": {name + _label_text(labels): h.to_dict()
+                               for (name, labels), h in sorted(self.histograms.items())}
+            }
+
+    def write_json(self, path):
+        _write_atomic(path, json.dumps(self.to_dict(), indent=2))
+
+    def to_prometheus(self):
+        lines = []
+        with self.lock:
+            counters = sorted(self.counters.items())
+            histograms = sorted(self.histograms.items())
+        typed = set()
+        for (name, labels), value in counters:
+            full = PREFIX + name
+            if full not in typed:
+                lines.append(f"# TYPE {full} counter")
+                typed.add(full)
+            lines.append(f"{full}{_label_text(labels)} {value}")
+        for (name, labels), h in histograms:
+            full = PREFIX + name
+            if full not in typed:
+                lines.append(f"# TYPE {full} histogram")
+                typed.add(full)
+            for bound, n in zip(h.buckets, h.counts):
+                lines.append(f"{full}_bucket{_label_text(labels + (('le', str(bound)),))} {n}")
+            lines.append(f"{full}_bucket{_label_text(labels + (('le', '+Inf'),))} {h.count}")
+            lines.append(f"{full}_sum{_label_text(labels)} {h.sum}")
+            lines.append(f"{full}_count{_label_text(labels)} {h.count}")
+        return "\n".join(lines) + "\n"
+
+    def write_prometheus(self, path):
+        _write_atomic(path, self.to_prometheus())
+
+
+def _write_atomic(path, text):
+    # node_exporter textfile toplayıcısı yarım yazılmış dosya görmesin
+    tmp = path + ".tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        f.write(text)
+    os.replace(tmp, path)
+
+
+METRICS = Metrics()
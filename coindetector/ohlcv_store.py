@@ -0,0 +1,156 @@
+import sqlite3
+import threading
+import time
+
+DAY = 86400
+
+COLUMNS = ["time", "open", "high", "low", "close", "volumefrom", "volumeto"]
+
+
+def month_key(timestamp):
+    # UTC "YYYY-MM"
+    tm = time.gmtime(timestamp)
+    return f"{tm.tm_year:04d}-{tm.tm_mon:02d}"
+
+
+def direction(open_, close):
+    # 0 = yükselen (buy), 1 = düşen (sell), 2 = yatay / karşılaştırılamayan (yarım buy, yarım sell)
+    if open_ is None or close is None:
+        return 2
+    if close > open_:
+        return 0
+    if close < open_:
+        return 1
+    return 2
+
+
+class OHLCVStore:
+    # CryptoCompare histoday mumlarını (fsym, tsym, gün) anahtarıyla yerel SQLite dosyasında tutar.
+    def __init__(self, path="ohlcv.db"):
+        self.path = path
+        # Bağlantı eşzamanlı indirme iş parçacıkları arasında paylaşılır
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self.lock = threading.Lock()
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS ohlcv ("
+            "fsym TEXT NOT NULL, tsym TEXT NOT NULL, time INTEGER NOT NULL, "
+            "open REAL, high REAL, low REAL, close REAL, volumefrom REAL, volumeto REAL, "
+            "PRIMARY KEY (fsym, tsym, time))"
+        )
+        has_monthly = self.conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'monthly'"
+        ).fetchone()
+        # Ay bazında yükselen/düşen/yatay gün sayaçları; kapanmış (closed) aylar artık güncellenmez
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS monthly ("
+            "fsym TEXT NOT NULL, tsym TEXT NOT NULL, month TEXT NOT NULL, "
+            "up INTEGER NOT NULL, down INTEGER NOT NULL, flat INTEGER NOT NULL, closed INTEGER NOT NULL, "
+            "PRIMARY KEY (fsym, tsym, month))"
+        )
+        if not has_monthly:
+            self._rebuild_monthly()
+        self.conn.commit()
+
+    def _rebuild_monthly(self):
+        # Sayaçlar olmadan oluşturulmuş eski bir depo için mevcut mumlardan bir kez hesaplanır
+        self.conn.execute(
+            "INSERT INTO monthly (fsym, tsym, month, up, down, flat, closed) "
+            "SELECT fsym, tsym, strftime('%Y-%m', time, 'unixepoch'), "
+            "SUM(CASE WHEN close > open THEN 1 ELSE 0 END), "
+            "SUM(CASE WHEN close < open THEN 1 ELSE 0 END), "
+            "SUM(CASE WHEN close > open OR close < open THEN 0 ELSE 1 END), 0 "
+            "FROM ohlcv GROUP BY fsym, tsym, strftime('%Y-%m', time, 'unixepoch')"
+        )
+        self.conn.execute(
+            "UPDATE monthly SET closed = 1 WHERE month < "
+            "(SELECT MAX(m.month) FROM monthly m WHERE m.fsym = monthly.fsym AND m.tsym = monthly.tsym)"
+        )
+
+    def _count_day(self, fsym, tsym, row, month):
+        # Yeni veya değişen bir günlük mum için ayın sayaçlarını O(1) günceller.
+        # Gün daha önce kaydedildiyse (ör. bugünün yarım mumu) eski yönü geri alınır;
+        # kapanmış bir ayda zaten sayılmış günler tekrar değerlendirilmez.
+        deltas = [0, 0, 0]
+        prev = self.conn.execute(
+            "SELECT open, close FROM ohlcv WHERE fsym = ? AND tsym = ? AND time = ?",
+            (fsym, tsym, row["time"])
+        ).fetchone()
+        if prev is not None:
+            closed = self.conn.execute(
+                "SELECT closed FROM monthly WHERE fsym = ? AND tsym = ? AND month = ?",
+                (fsym, tsym, month)
+            ).fetchone()
+            if closed is not None and closed[0]:
+                return
+            deltas[direction(prev[0], prev[1])] -= 1
+        deltas[direction(row.get("open"), row.get("close"))] += 1
+        self.conn.execute(
+            "INSERT OR IGNORE INTO monthly (fsym, tsym, month, up, down, flat, closed) VALUES (?, ?, ?, 0, 0, 0, 0)",
+            (fsym, tsym, month)
+        )
+        self.conn.execute(
+            "UPDATE monthly SET up = up + ?, down = down + ?, flat = flat + ? "
+            "WHERE fsym = ? AND tsym = ? AND month = ?",
+            (deltas[0], deltas[1], deltas[2], fsym, tsym, month)
+        )
+
+    def day_range(self, fsym, tsym):
+        # (ilk gün, son gün) timestamp'leri, kayıt yoksa (None, None)
+        with self.lock:
+            row = self.conn.execute(
+                "SELECT MIN(time), MAX(time) FROM ohlcv WHERE fsym = ? AND tsym = ?",
+                (fsym, tsym)
+            ).fetchone()
+        return row[0], row[1]
+
+    def day_count(self, fsym, tsym, from_ts, to_ts):
+        # [from_ts, to_ts] aralığında kayıtlı gün sayısı
+        with self.lock:
+            row = self.conn.execute(
+                "SELECT COUNT(*) FROM ohlcv WHERE fsym = ? AND tsym = ? AND time >= ? AND time <= ?",
+                (fsym, tsym, from_ts, to_ts)
+            ).fetchone()
+        return row[0]
+
+    def save(self, fsym, tsym, rows):
+        # Aynı gün tekrar gelirse (ör. bugünün yarım mumu) üzerine yazılır
+        with self.lock:
+            last_month = None
+            for row in sorted(rows, key=lambda r: r["time"]):
+                month = month_key(row["time"])
+                self._count_day(fsym, tsym, row, month)
+                if month != last_month:
+                    # Sonraki aya ait bir mum geldiyse önceki aylar kapanmıştır
+                    self.conn.execute(
+                        "UPDATE monthly SET closed = 1 WHERE fsym = ? AND tsym = ? AND month < ? AND closed = 0",
+                        (fsym, tsym, month)
+                    )
+                    last_month = month
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO ohlcv (fsym, tsym, " + ", ".join(COLUMNS) + ") "
+                "VALUES (?, ?, " + ", ".join("?" * len(COLUMNS)) + ")",
+                [(fsym, tsym) + tuple(row.get(col, 0) for col in COLUMNS) for row in rows]
+            )
+            self.conn.commit()
+
+    def load(self, fsym, tsym, from_ts, to_ts):
+        with self.lock:
+            rows = self.conn.execute(
+                "SELECT " + ", ".join(COLUMNS) + " FROM ohlcv "
+                "WHERE fsym = ? AND tsym = ? AND time >= ? AND time <= ? ORDER BY time",
+                (fsym, tsym, from_ts, to_ts)
+            ).fetchall()
+        return [dict(zip(COLUMNS, row)) for row in rows]
+
+    def month_counts(self, fsym, tsym, to_ts, count=6):
+        # to_ts gününün ayı dahil son `count` ayın sayaçları, eskiden yeniye: [(yıl, ay, up, down, flat), ...]
+        with self.lock:
+            rows = self.conn.execute(
+                "SELECT month, up, down, flat FROM monthly "
+                "WHERE fsym = ? AND tsym = ? AND month <= ? ORDER BY month DESC LIMIT ?",
+                (fsym, tsym, month_key(to_ts), count)
+            ).fetchall()
+        return [(int(month[:4]), int(month[5:]), up, down, flat) for month, up, down, flat in reversed(rows)]
+
+    def close(self):
+        self.conn.close()
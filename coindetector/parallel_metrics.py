@@ -0,0 +1,98 @@
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from .batch_indicators import BatchMetrics
+from .indicators import stored_months
+from .ohlcv_store import OHLCVStore, DAY
+from .pipeline import get_trend
+
+CHUNK_SIZE = 256  # Bir iş biriminde hesaplanan coin sayısı
+HISTORY_DAYS = 730
+
+_worker = {}  # İşçi süreç durumu: paylaşımlı bellek, dizi görünümleri ve (varsa) depo bağlantısı
+
+
+def _views(buf, total):
+    # Tek bloktaki [gün | açılış | kapanış] bölümlerinin kopyasız NumPy görünümleri
+    days = np.ndarray((total,), dtype="datetime64[D]", buffer=buf, offset=0)
+    opens = np.ndarray((total,), dtype=np.float64, buffer=buf, offset=total * 8)
+    closes = np.ndarray((total,), dtype=np.float64, buffer=buf, offset=total * 16)
+    return days, opens, closes
+
+
+def pack(arrays):
+    # Tüm coinlerin (gün, açılış, kapanış) dizileri art arda tek paylaşımlı bellek bloğuna yazılır;
+    # işçilere sadece blok adı ve coin başına başlangıç/bitiş indeksleri gider, dict listeleri pickle edilmez.
+    lengths = [len(days) for days, _, _ in arrays]
+    offsets = np.concatenate(([0], np.cumsum(lengths, dtype=np.int64))).tolist()
+    total = offsets[-1]
+    shm = shared_memory.SharedMemory(create=True, size=max(1, total * 24))
+    days, opens, closes = _views(shm.buf, total)
+    for (d, o, c), start, stop in zip(arrays, offsets[:-1], offsets[1:]):
+        days[start:stop] = d
+        opens[start:stop] = o
+        closes[start:stop] = c
+    del days, opens, closes  # blok kapanmadan önce görünümler bırakılmalı
+    return shm, offsets, total
+
+
+def _init_worker(shm_name, total, store_path):
+    shm = shared_memory.SharedMemory(name=shm_name)
+    _worker["shm"] = shm
+    _worker["arrays"] = _views(shm.buf, total)
+    # Ay sayaçları her işçide kendi SQLite bağlantısıyla yerel depodan okunur
+    _worker["store"] = OHLCVStore(store_path) if store_path else None
+
+
+def _compute_chunk(offsets, keys):
+    days, opens, closes = _worker["arrays"]
+    arrays = [(days[a:b], opens[a:b], closes[a:b]) for a, b in zip(offsets[:-1], offsets[1:])]
+    return compute(arrays, keys, _worker["store"])
+
+
+def compute(arrays, keys, store=None):
+    # pipeline.history_metrics ile aynı satırlar: (change_2y, buy_ratio_1m, sell_ratio_1m, months, uptrend)
+    batch = BatchMetrics(arrays, monthly=store is None)
+    metrics = []
+    for i, ((days, opens, closes), (fsym, tsym)) in enumerate(zip(arrays, keys)):
+        buy_ratio_1m, sell_ratio_1m = batch.ratio_1m(i)
+        if store is None:
+            last_6 = batch.last_6(i)
+            uptrend = bool(batch.uptrend[i])
+        else:
+            last_6 = []
+            if len(days):
+                to_ts = int(days[-1].astype(np.int64)) * DAY
+                # Son 180 günlük pencere (histoday limit=180 için 181 gün)
+                last_6 = stored_months(store.month_counts(fsym, tsym, to_ts, 6),
+                                       days[-181:], opens[-181:], closes[-181:])
+            uptrend = get_trend(last_6)
+        metrics.append((batch.change(i), buy_ratio_1m, sell_ratio_1m,
+                        tuple((dt, br, sr) for dt, _, br, sr in last_6), uptrend))
+    return metrics
+
+
+def parallel_history_metrics(histories, workers=None, chunk_size=CHUNK_SIZE):
+    # Geçmişe bağlı metrikleri süreç havuzunda, chunk_size coinlik iş birimleri halinde hesaplar.
+    # Tüm geçmişler aynı dosya tabanlı depodaysa aylık oranlar işçilerde depodaki sayaçlardan okunur.
+    if not histories:
+        return []
+    store_path = histories[0].store.path if histories[0].store is not None else None
+    if store_path == ":memory:" or any(h.store is None or h.store.path != store_path for h in histories):
+        store_path = None
+    keys = [(h.fsym, h.tsym) for h in histories]
+
+    shm, offsets, total = pack([h.window(HISTORY_DAYS) for h in histories])
+    try:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                 initargs=(shm.name, total, store_path)) as executor:
+            futures = [
+                executor.submit(_compute_chunk, offsets[start:start + chunk_size + 1], keys[start:start + chunk_size])
+                for start in range(0, len(histories), chunk_size)
+            ]
+            return [row for future in futures for row in future.result()]
+    finally:
+        shm.close()
+        shm.unlink()
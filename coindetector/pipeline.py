@@ -0,0 +1,611 @@
+import time
+from itertools import islice
+
+from . import http_client
+from .http_client import get_json
+from .ohlcv_store import OHLCVStore, DAY
+from .fetch_engine import RateLimiter, fetch_all, CRYPTOCOMPARE_PER_SECOND, CRYPTOCOMPARE_PER_MINUTE
+from .indicators import buy_sell_ratio, monthly_ratios, stored_months
+from .batch_indicators import BatchMetrics
+from .daily_ring import DailyRing
+from .records import ScreenedCoin
+from .screening import ScreeningSpec, potential, popularity, ranked
+from .symbol_index import SymbolIndex, load_overrides
+from .metrics import METRICS
+
+# API adresleri; kayıt/tekrar oynatma (replay.py) için yerel sunucuya yönlendirilebilir
+COINGECKO_API = "https://api.coingecko.com/api/v3"
+CRYPTOCOMPARE_API = "https://min-api.cryptocompare.com/data"
+PRICEMULTI_FSYMS_MAX = 300  # pricemultifull fsyms parametresinin karakter sınırı
+HISTODAY_RETRIES = 4  # Kota / geçici hatalarda histoday en fazla bu kadar tekrar denenir (1, 2, 4, 8 sn bekleyerek)
+
+
+class UnsupportedPair(Exception):
+    # CryptoCompare bu coin / para birimi çifti için hiç veri tutmuyor
+    pass
+
+
+class CryptoCompareError(Exception):
+    # Tekrar denemelere rağmen CryptoCompare hata döndü (ör. kota aşımı); coin 0 / 50-50 olarak sonuçlara girmesin
+    pass
+
+
+def get_reliable_coins(market_cap_min=1000000000, volume_min=50000000, per_page=250, vs_currency="usd"):
+    # Piyasa listesini sayfa sayfa tembel (lazy) olarak dolaşır.
+    # Sonuçlar market_cap_desc sıralı olduğundan sayfa market_cap_min altına indiğinde durur.
+    url = COINGECKO_API + "/coins/markets"
+    page = 1
+    while True:
+        params = {
+            "vs_currency": vs_currency,
+            "order": "market_cap_desc",
+            "per_page": per_page,
+            "page": page,
+            "sparkline": "false"
+        }
+
+        coins = get_json(url, params)
+
+        for coin in coins:
+            if (coin["market_cap"] is not None and coin["market_cap"] >= market_cap_min) and \
+                    (coin["total_volume"] is not None and coin["total_volume"] >= volume_min):
+                yield {
+                    "id": coin["id"],
+                    "name": coin["name"],
+                    "symbol": coin["symbol"].upper(),
+                    "price": coin["current_price"],
+                    "market_cap": coin["market_cap"],
+                    "volume_24h": coin["total_volume"]
+                }
+
+        caps = [coin["market_cap"] for coin in coins if coin["market_cap"] is not None]
+        if len(coins) < per_page or not caps or min(caps) < market_cap_min:
+            return
+        page += 1
+
+
+def fetch_histoday(fsym="BTC", tsym="USD", limit=30, to_ts=None, limiter=None):
+    url = CRYPTOCOMPARE_API + "/v2/histoday"
+    params = {
+        "fsym": fsym,
+        "tsym": tsym,
+        "limit": limit
+    }
+    if to_ts is not None:
+        params["toTs"] = to_ts
+    # CryptoCompare hataları (kota, hız sınırı) HTTP 200 ve Response: "Error" ile döner, üstel beklemeyle tekrar dene
+    for attempt in range(HISTODAY_RETRIES + 1):
+        data = get_json(url, params, limiter=limiter)
+        if data.get("Response") == "Success":
+            return data["Data"]["Data"]
+        message = data.get("Message") or ""
+        if "does not exist" in message:
+            # ör. "cccagg_or_exchange market does not exist for this coin pair (XYZ-USD)"
+            raise UnsupportedPair(f"{fsym}-{tsym}")
+        METRICS.inc("cryptocompare_errors_total", endpoint="histoday")
+        if attempt < HISTODAY_RETRIES:
+            time.sleep(2 ** attempt)
+    raise CryptoCompareError(f"histoday {fsym}-{tsym}: {message or 'unknown error'}")
+
+
+def get_coin_lists():
+    # Sembol indeksi için iki sağlayıcının tüm coin listeleri; biri alınamazsa (None, None).
+    # Yanıtlar büyük olduğundan HTTP önbelleğine yazılmaz, indeks dosyası zaten kalıcıdır.
+    coingecko = get_json(COINGECKO_API + "/coins/list", use_cache=False)
+    cryptocompare = get_json(CRYPTOCOMPARE_API + "/all/coinlist", {"summary": "true"}, use_cache=False)
+    if not isinstance(coingecko, list) or not coingecko:
+        return None, None
+    if not isinstance(cryptocompare, dict) or not cryptocompare.get("Data"):
+        return None, None
+    return coingecko, cryptocompare["Data"]
+
+
+def refresh_symbol_index(index, now=None):
+    # Günde bir kez iki sağlayıcının listesinden yeniden kurulur; listeler alınamazsa eski indeks kullanılır
+    if index.is_stale(now):
+        coingecko, cryptocompare = get_coin_lists()
+        if coingecko is not None:
+            index.rebuild(coingecko, cryptocompare, now)
+            index.save()
+    return index
+
+
+def open_symbol_index(path="symbol_index.json", overrides_path="symbol_overrides.json"):
+    return refresh_symbol_index(SymbolIndex(path, load_overrides(overrides_path)))
+
+
+def chunk_symbols(symbols, max_length=PRICEMULTI_FSYMS_MAX):
+    # Sembolleri virgülle birleştirilmiş hali max_length karakteri geçmeyecek gruplara böler
+    chunk, length = [], 0
+    for symbol in symbols:
+        if chunk and length + 1 + len(symbol) > max_length:
+            yield chunk
+            chunk, length = [], 0
+        length += len(symbol) + (1 if chunk else 0)
+        chunk.append(symbol)
+    if chunk:
+        yield chunk
+
+
+def fetch_quotes(fsyms, tsym="USD", limiter=None, now=None):
+    # Tüm semboller için anlık fiyat ve bugünün (UTC) yarım mumu.
+    # Sembol başına bir histoday isteği yerine her fsyms grubu için tek pricemultifull isteği atılır.
+    # Dönüş: {fsym: {"price", "candle"}}, fiyatı gelmeyen semboller atlanır
+    url = CRYPTOCOMPARE_API + "/pricemultifull"
+    today = int(time.time() if now is None else now) // DAY * DAY
+    quotes = {}
+    for chunk in chunk_symbols(list(dict.fromkeys(fsyms))):
+        data = get_json(url, {"fsyms": ",".join(chunk), "tsyms": tsym}, limiter=limiter)
+        raw = (data.get("RAW") or {}) if isinstance(data, dict) else {}
+        for fsym in chunk:
+            quote = (raw.get(fsym) or {}).get(tsym)
+            if not quote or quote.get("PRICE") is None:
+                continue
+            quotes[fsym] = {
+                "price": quote["PRICE"],
+                "candle": {
+                    "time": today,
+                    "open": quote.get("OPENDAY"),
+                    "high": quote.get("HIGHDAY"),
+                    "low": quote.get("LOWDAY"),
+                    "close": quote["PRICE"],
+                    "volumefrom": quote.get("VOLUMEDAY"),
+                    "volumeto": quote.get("VOLUMEDAYTO")
+                }
+            }
+    return quotes
+
+
+def quoted_coin(coin, quote):
+    # Piyasa listesindeki coin satırının anlık fiyatla güncellenmiş kopyası.
+    # CryptoCompare'in MKTCAP / TOTALVOLUME24HTO değerleri CoinGecko'nunkilerle aynı şeyi ölçmez; karışırsa
+    # potential ve popularity iki yenileme türü arasında zıplar. Piyasa değeri (dolaşımdaki arz sabit kabul edilerek)
+    # fiyat oranıyla ölçeklenir, 24s hacim bir sonraki piyasa listesine kadar CoinGecko'nun değeri olarak kalır.
+    if quote is None:
+        return coin
+    quoted = dict(coin, price=quote["price"])
+    if coin["price"] and coin["market_cap"]:
+        quoted["market_cap"] = coin["market_cap"] * quote["price"] / coin["price"]
+    return quoted
+
+
+def stored_last_day(store, fsym, tsym, from_ts):
+    # Depo from_ts'ten son kaydına kadar her günü tutuyorsa son kaydın timestamp'i, yoksa None.
+    # Sadece ilk/son güne bakmak yetmez: kısa bir pencere (ör. RANK_PROBES) eski bir kaydın üstüne yazılmışsa
+    # arada inmemiş günler kalır ve bunlar artımlı istekle hiç çekilmez.
+    first_ts, last_ts = store.day_range(fsym, tsym)
+    if first_ts is None or first_ts > from_ts or last_ts < from_ts:
+        return None
+    if store.day_count(fsym, tsym, from_ts, last_ts) < (last_ts - from_ts) // DAY + 1:
+        return None
+    return last_ts
+
+
+def get_historical_data_cryptocompare(fsym="BTC", tsym="USD", limit=30, store=None, limiter=None):
+    if store is None:
+        return fetch_histoday(fsym, tsym, limit, limiter=limiter)
+
+    # Yerel depoda olan günleri tekrar indirme, sadece son kayıttan sonrasını iste.
+    # Son kayıtlı gün de yeniden çekilir çünkü o günün mumu kaydedildiğinde henüz kapanmamış olabilir.
+    # Depoda eksik gün varsa pencerenin tamamı yeniden indirilir (yine tek istek).
+    today = int(time.time()) // DAY * DAY
+    from_ts = today - limit * DAY
+    last_ts = stored_last_day(store, fsym, tsym, from_ts)
+    if last_ts is None:
+        data = fetch_histoday(fsym, tsym, limit, limiter=limiter)
+    else:
+        # histoday için belgelenmiş en küçük limit 1; aynı gün ikinci çalıştırmada dün ve bugün birlikte gelir
+        data = fetch_histoday(fsym, tsym, max(1, (today - last_ts) // DAY), to_ts=today, limiter=limiter)
+    store.save(fsym, tsym, data)
+    return store.load(fsym, tsym, from_ts, today)
+
+
+class CoinHistory:
+    # Coin'in günlük verisi bir kez (730 gün) çekilir, 30 ve 180 günlük pencereler bu seriden kesilir.
+    # Seri sabit boyutlu bir halka tamponda (DailyRing) tutulur: yeni gün eklenince en eski gün düşer,
+    # pencereler kopyasız görünümlerdir.
+    def __init__(self, fsym="BTC", tsym="USD", limit=730, store=None, limiter=None):
+        unsupported = False
+        try:
+            data = get_historical_data_cryptocompare(fsym, tsym, limit, store, limiter) or []
+        except UnsupportedPair:
+            unsupported = True
+            data = []
+        # histoday limit=N için N+1 satır döner
+        self._attach(fsym, tsym, DailyRing.from_rows(data, limit + 1), store, unsupported)
+
+    @classmethod
+    def from_ring(cls, fsym, tsym, ring, store=None):
+        # Ağa gitmeden hazır bir halka tampondan (testler, sentetik benchmark'lar); limit ring'in kapasitesinden gelir
+        history = cls.__new__(cls)
+        history._attach(fsym, tsym, ring, store)
+        return history
+
+    def _attach(self, fsym, tsym, ring, store=None, unsupported=False):
+        self.fsym = fsym
+        self.tsym = tsym
+        self.limit = ring.capacity - 1
+        self.store = store
+        self.unsupported = unsupported
+        self.ring = ring
+
+    def __len__(self):
+        return len(self.ring)
+
+    def last_time(self):
+        # Son mumun zaman damgası (saniye), seri boşsa None
+        last_day = self.ring.last_day
+        return None if last_day is None else last_day * DAY
+
+    def window(self, limit):
+        # Son limit + 1 günün NumPy görünümü: (gün, açılış, kapanış)
+        count = limit + 1
+        return self.ring.days(count), self.ring.column("open", count), self.ring.column("close", count)
+
+    def apply_candle(self, candle):
+        # Bugünün yarım mumunu (ör. fetch_quotes) seriye yazar: aynı gün varsa üzerine yazılır, yeni günse eklenip
+        # en eski gün düşer. Depo varsa mum oraya da kaydedilir, böylece ay sayaçları da güncel kalır.
+        last_day = self.ring.last_day
+        day = candle["time"] // DAY
+        if last_day is not None and last_day > day:
+            return
+        self.ring.append(day, candle)
+        if self.store is not None:
+            self.store.save(self.fsym, self.tsym, [candle])
+
+
+def get_2y_change(history):
+    closes = history.window(730)[2]
+    if len(closes) > 1:
+        first_price = float(closes[0])
+        last_price = float(closes[-1])
+        if first_price > 0:
+            change = ((last_price - first_price) / first_price) * 100
+        else:
+            change = 0
+        return change
+    return 0
+
+
+def get_1m_buy_sell_ratio(history):
+    _, opens, closes = history.window(30)
+    return buy_sell_ratio(opens, closes)
+
+
+def get_6_months_data(history):
+    # Yerel depo varsa kalıcı ay sayaçlarından okunur, yoksa son 180 gün ay bazında gruplanır.
+    # Son 6 aya ihtiyacımız var, format: [(datetime, month_name, buy_ratio, sell_ratio), ...]
+    if history.store is not None and len(history):
+        counts = history.store.month_counts(history.fsym, history.tsym, history.last_time(), 6)
+        return stored_months(counts, *history.window(180))
+    return monthly_ratios(*history.window(180))[-6:]
+
+
+def get_trend(last_6):
+    # Son 6 ayın verisi tam 6 ay ise, en az 4 ay buy>sell ise uptrend.
+    # Eğer 6 aydan az veri varsa uptrend yok.
+    count_buy_higher = sum(1 for _, _, br, sr in last_6 if br > sr)
+    return len(last_6) == 6 and count_buy_higher >= 4
+
+
+# Geçmişe bağlı sıralamada önce sadece sıralama alanı için gereken kadar gün çekilir (ör. 1 aylık oran için
+# son 31 gün), tam geçmiş yalnızca ilk sıralardaki coinler için indirilir; bu yol sadece yerel depo adayların
+# tam penceresini tutarken kullanılır (bkz. screen_staged). Burada olmayan alanlar (change_2y, uptrend) zaten
+# tam geçmiş ister. Alan -> (histoday limiti, kısa geçmişten değer)
+RANK_PROBES = {
+    "buy_ratio_1m": (30, lambda history: get_1m_buy_sell_ratio(history)[0]),
+    "sell_ratio_1m": (30, lambda history: get_1m_buy_sell_ratio(history)[1])
+}
+
+
+def fetch_histories(coins, tsym="USD", store=None, concurrency=8, limiter=None, on_coin=None, on_history=None,
+                    limit=730):
+    # Geçmiş verileri paralel çek, sıralama coins ile aynı kalır.
+    # on_history(coin, history) her coinin geçmişi gelir gelmez indirme iş parçacığında çağrılır.
+    # Hız sınırı HTTP katmanında uygulanır, önbellekten gelen yanıtlar beklemeden döner.
+    def fetch(coin):
+        with METRICS.timer("coin_fetch_seconds"):
+            history = CoinHistory(coin.get('fsym', coin['symbol']), tsym, limit, store, limiter)
+        if on_history is not None:
+            on_history(coin, history)
+        return history
+
+    return fetch_all(
+        coins,
+        fetch,
+        concurrency=concurrency,
+        on_done=on_coin
+    )
+
+
+def drop_unsupported(coins, histories, index=None):
+    # CryptoCompare'in hiç veri tutmadığı coinler 0 / 50-50 olarak sonuçlara girmesin; index verilmişse
+    # kaydedilir ve bir süre tekrar istenmez. Dönüş: [(coin, history), ...]
+    supported = []
+    for coin, history in zip(coins, histories):
+        if history.unsupported:
+            METRICS.inc("unsupported_symbols_total")
+            if index is not None:
+                index.mark_unsupported(coin['id'])
+        else:
+            supported.append((coin, history))
+    return supported
+
+
+def history_metrics(histories, batch_mode=True, workers=0):
+    # Geçmişe bağlı metrikler, her coin için (change_2y, buy_ratio_1m, sell_ratio_1m, months, uptrend)
+    # workers > 0 ise hesaplama o kadar süreçli havuza dağıtılır (bkz. parallel_metrics.py)
+    if not histories:
+        return []
+    if workers:
+        from .parallel_metrics import parallel_history_metrics
+        return parallel_history_metrics(histories, workers)
+    metrics = []
+    if batch_mode:
+        # Ay sayaçları depodan okunabiliyorsa aylık oranlar matris üzerinden tekrar hesaplanmaz
+        from_counters = all(h.store is not None for h in histories)
+        with METRICS.stage("batch_matrix"):
+            batch = BatchMetrics([h.window(730) for h in histories], monthly=not from_counters)
+        for i, history in enumerate(histories):
+            with METRICS.timer("coin_compute_seconds"):
+                buy_ratio_1m, sell_ratio_1m = batch.ratio_1m(i)
+                if from_counters:
+                    last_6 = get_6_months_data(history)
+                    uptrend = get_trend(last_6)
+                else:
+                    last_6 = batch.last_6(i)
+                    uptrend = bool(batch.uptrend[i])
+                metrics.append((batch.change(i), buy_ratio_1m, sell_ratio_1m,
+                                tuple((dt, br, sr) for dt, _, br, sr in last_6), uptrend))
+    else:
+        for history in histories:
+            with METRICS.timer("coin_compute_seconds"):
+                buy_ratio_1m, sell_ratio_1m = get_1m_buy_sell_ratio(history)
+                last_6 = get_6_months_data(history)
+                metrics.append((get_2y_change(history), buy_ratio_1m, sell_ratio_1m,
+                                tuple((dt, br, sr) for dt, _, br, sr in last_6), get_trend(last_6)))
+    return metrics
+
+
+def build_results(coins, metrics, avg_volume=None):
+    # Piyasa verisinden gelen (ucuz) metrikler ile geçmiş metriklerini birleştirir.
+    # avg_volume verilmezse popularity bu coinlerin ortalama hacmine göre hesaplanır.
+    if not coins:
+        return []
+
+    if avg_volume is None:
+        avg_volume = sum(c['volume_24h'] for c in coins) / len(coins)
+
+    results = []
+    for coin, (change_2y, buy_ratio_1m, sell_ratio_1m, months, uptrend) in zip(coins, metrics):
+        results.append(ScreenedCoin(
+            coin['name'],
+            coin['symbol'],
+            coin['price'],
+            coin['market_cap'],
+            coin['volume_24h'],
+            potential(coin),
+            popularity(coin, avg_volume),
+            buy_ratio_1m,
+            sell_ratio_1m,
+            change_2y,
+            months=months,
+            uptrend=uptrend
+        ))
+    return results
+
+
+def screen(coins, tsym="USD", store=None, concurrency=8, limiter=None, batch_mode=True, on_coin=None, workers=0):
+    # Her coin için ham (sayısal, biçimlenmemiş) sonuçları bir kez hesaplar; tüm çıktılar bu listeyi kullanır
+    return screen_staged(coins, tsym, store, concurrency, limiter, batch_mode, on_coin, workers)[0]
+
+
+def screen_staged(coins, tsym="USD", store=None, concurrency=8, limiter=None, batch_mode=True, on_coin=None,
+                  workers=0, spec=None, avg_volume=None, index=None, on_result=None):
+    # Piyasa aşamasını geçmiş adaylar için geçmişi çekip spec'in geçmiş koşullarını, sıralamasını ve limitini uygular.
+    # Limit varsa ve sıralama geçmişe bağlı değilse adaylar sırayla gruplar halinde işlenir, limit dolunca
+    # kalan coinler için histoday isteği atılmaz. Sıralama RANK_PROBES'taki bir alana göreyse adaylar önce kısa
+    # geçmişle sıralanır ve tam geçmiş aynı şekilde sadece ilk sıralardakiler için çekilir (depo tam pencereyi
+    # tutuyorsa). Dönüş: (sonuçlar, geçmişler)
+    # CryptoCompare'in hiç veri tutmadığı coinler sonuçlara 0 / 50-50 olarak girmez, index verilmişse kaydedilir.
+    # on_result(result) verilirse her coinin sonucu geçmişi gelir gelmez tek başına hesaplanıp bildirilir
+    # (akış çıktısı); bu durumda toplu/süreç havuzlu hesaplama kullanılmaz.
+    if avg_volume is None and coins:
+        avg_volume = sum(c['volume_24h'] for c in coins) / len(coins)
+
+    def process(batch, progress=True):
+        streamed = {}
+
+        def on_history(coin, history):
+            if history.unsupported:
+                return
+            result = build_results([coin], history_metrics([history], batch_mode=False), avg_volume)[0]
+            streamed[id(coin)] = result
+            if spec is None or spec.match_history(result):
+                on_result(result)
+
+        with METRICS.stage("cryptocompare"):
+            histories = fetch_histories(batch, tsym, store, concurrency, limiter, on_coin if progress else None,
+                                        on_history if on_result is not None else None)
+        supported = drop_unsupported(batch, histories, index)
+        batch = [coin for coin, _ in supported]
+        histories = [history for _, history in supported]
+        with METRICS.stage("compute"):
+            if on_result is not None:
+                results = [streamed[id(coin)] for coin in batch]
+            else:
+                results = build_results(batch, history_metrics(histories, batch_mode, workers), avg_volume)
+        return [(r, h) for r, h in zip(results, histories) if spec is None or spec.match_history(r)]
+
+    def probe_order(field):
+        # Sıralama alanı kısa bir pencereden kesin olarak hesaplanabiliyorsa adaylar önce o pencereyle sıralanır
+        limit, value = RANK_PROBES[field]
+        with METRICS.stage("cryptocompare"):
+            histories = fetch_histories(coins, tsym, store, concurrency, limiter, on_coin, limit=limit)
+        values = {id(coin): value(history) for coin, history in drop_unsupported(coins, histories, index)}
+        probed = [coin for coin in coins if id(coin) in values]
+        return ranked(probed, key=lambda coin: values[id(coin)], descending=spec.descending)
+
+    def probe_ready():
+        # Kısa geçmişle sıralama sadece depo tüm adayların tam (730 günlük) penceresini boşluksuz tutuyorsa
+        # yapılır: o zaman yoklama ve ardından gelen tam geçmiş aynı artımlı isteği paylaşır. Aksi halde
+        # n aday için n + K istek atılır ve kısa bloklar depoda boşluk bırakır; doğrudan tam geçmiş çekilir.
+        if store is None:
+            return False
+        from_ts = int(time.time()) // DAY * DAY - 730 * DAY
+        return all(stored_last_day(store, coin.get('fsym', coin['symbol']), tsym, from_ts) is not None
+                   for coin in coins)
+
+    def take(candidates, progress=True):
+        # Sıradaki adayları gruplar halinde işler, limit dolunca kalanların geçmişi çekilmez
+        pairs = []
+        candidates = iter(candidates)
+        while len(pairs) < spec.limit:
+            # Geçmiş koşulu yoksa her aday sonuca girer, tam olarak eksik kadarı çekilir. Akış çıktısında da
+            # grup eksik kadar tutulur: eşleşen her satır hemen basıldığından limitten fazlası ekrana düşmesin.
+            needed = spec.limit - len(pairs)
+            wide = spec.history and on_result is None
+            batch = list(islice(candidates, max(needed, concurrency) if wide else needed))
+            if not batch:
+                break
+            pairs += process(batch, progress)
+        return pairs
+
+    if spec is not None and spec.limit is not None and spec.order_by in RANK_PROBES and probe_ready():
+        # İlerleme coin başına bir kez, kısa geçmiş çekilirken sayılır
+        pairs = take(probe_order(spec.order_by), progress=False)
+    elif spec is None or not spec.history or spec.limit is None or spec.orders_by_history:
+        pairs = process(coins)
+    else:
+        pairs = take(coins)
+
+    results, histories = [r for r, _ in pairs], [h for _, h in pairs]
+    if spec is not None:
+        results, histories = spec.finish(results, histories)
+    return results, histories
+
+
+class NullProgress:
+    # progress=False iken tqdm hiç yüklenmez
+    total = 0
+
+    def update(self, n=1):
+        pass
+
+    def refresh(self):
+        pass
+
+    def close(self):
+        pass
+
+
+def run(sinks, top_count=None, max_price=10.0, tsym="USD", store_path="ohlcv.db", concurrency=8,
+        rate_per_second=CRYPTOCOMPARE_PER_SECOND, rate_per_minute=CRYPTOCOMPARE_PER_MINUTE,
+        batch_mode=True, progress=True, record_dir=None, metrics_path=None, prometheus_path=None,
+        profile_path=None, workers=0, market_cap_min=1000000000, volume_min=50000000, spec=None,
+        index_path="symbol_index.json", overrides_path="symbol_overrides.json", rank_by=None):
+    # Veriyi bir kez çek ve hesapla, ardından aynı sonuç kümesini seçilen tüm çıktılara (sink) ver.
+    # metrics_path / prometheus_path: aşama ve HTTP ölçümlerinin JSON / Prometheus textfile özeti,
+    # profile_path: tüm çalıştırmanın cProfile çıktısı (ör. snakeviz ile açılır)
+    # spec: tarama ifadesi (bkz. screening.py), verilmezse "price < max_price"
+    # index_path: CoinGecko id -> CryptoCompare sembol indeksi (bkz. symbol_index.py), None ise semboller olduğu gibi
+    # rank_by: verilirse piyasa değerine göre ilk top_count coin yerine tüm piyasadan bu alanda en yüksek top_count
+    # coin seçilir (ör. "potential", "popularity", "change_2y", "buy_ratio_1m")
+    if spec is None:
+        spec = ScreeningSpec(f"price < {max_price!r}")
+    elif isinstance(spec, str):
+        spec = ScreeningSpec.parse(spec)
+    if rank_by:
+        spec = ScreeningSpec(spec.where, rank_by, True, spec.limit or top_count)
+        top_count = None
+    if record_dir:
+        http_client.record_dir = record_dir
+    METRICS.reset()
+    profiler = None
+    if profile_path:
+        import cProfile
+        profiler = cProfile.Profile()
+        profiler.enable()
+    try:
+        with METRICS.stage("total"):
+            results = _run(sinks, top_count, spec, tsym, store_path, concurrency,
+                           rate_per_second, rate_per_minute, batch_mode, progress, workers, market_cap_min,
+                           volume_min, index_path, overrides_path)
+    finally:
+        if profiler is not None:
+            profiler.disable()
+            profiler.dump_stats(profile_path)
+        if metrics_path:
+            METRICS.write_json(metrics_path)
+        if prometheus_path:
+            METRICS.write_prometheus(prometheus_path)
+    return results
+
+
+def _run(sinks, top_count, spec, tsym, store_path, concurrency, rate_per_second, rate_per_minute,
+         batch_mode, progress, workers, market_cap_min, volume_min, index_path, overrides_path):
+    # Akış çıktısı satırları zaten ilerlemeyi gösterir, ilerleme çubuğu satırların arasına girmesin
+    streams = [sink for sink in sinks if hasattr(sink, "add")]
+    if progress and not streams:
+        from tqdm import tqdm
+        pbar = tqdm(total=0, desc="Overall progress", unit="step")
+    else:
+        pbar = NullProgress()
+
+    # 1. Güvenilir coinleri akış olarak çek, top_count varsa o kadar coin al (gereksiz sayfalar indirilmez)
+    # 2. Sadece piyasa verisine bakan koşullarla (ör. fiyat) adayları filtrele, geçmiş henüz çekilmez
+    with METRICS.stage("coingecko"):
+        market_cap_min, volume_min = spec.list_bounds(market_cap_min, volume_min)
+        reliable_coins = get_reliable_coins(market_cap_min, volume_min, vs_currency=tsym.lower())
+        if top_count:
+            reliable_coins = islice(reliable_coins, top_count)
+        reliable_coins = list(reliable_coins)
+        # Sembolleri CryptoCompare karşılıklarına çevir, orada olmayan coinler için hiç istek atma
+        index = open_symbol_index(index_path, overrides_path) if index_path else None
+        if index is not None:
+            reliable_coins = index.resolve(reliable_coins)
+        candidates, avg_volume = spec.filter_market(reliable_coins)
+    pbar.update(2)
+
+    pbar.total = 2 + len(candidates) + len(sinks)
+    pbar.refresh()
+
+    def stream(result):
+        for sink in streams:
+            sink.add(result)
+
+    store = OHLCVStore(store_path) if store_path else None
+    try:
+        # 3. Adayların geçmişini çek, geçmişe bağlı koşulları, sıralamayı ve limiti uygula
+        results, histories = screen_staged(
+            candidates,
+            tsym=tsym,
+            store=store,
+            concurrency=concurrency,
+            limiter=RateLimiter(rate_per_second, rate_per_minute),
+            batch_mode=batch_mode,
+            on_coin=lambda _: pbar.update(1),  # coin işleme adımı
+            workers=workers,
+            spec=spec,
+            avg_volume=avg_volume,
+            index=index,
+            on_result=stream if streams else None
+        )
+    finally:
+        if store is not None:
+            store.close()
+        if index is not None:
+            index.save()
+
+    for sink in sinks:
+        with METRICS.stage("sink:" + type(sink).__name__):
+            sink.write(results)
+            # Sütunlu çıktılar (columnar.py) coin başına günlük mumları da saklar
+            if hasattr(sink, "write_histories"):
+                sink.write_histories(histories)
+        pbar.update(1)  # çıktı adımı
+    pbar.close()
+
+    for sink in sinks:
+        sink.close()
+    return results
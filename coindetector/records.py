@@ -0,0 +1,35 @@
+class ScreenedCoin:
+    # Taranan bir coinin yalnızca sayısal alanları; metin biçimlendirme sadece çıktı (sink) aşamasında yapılır.
+    # months: en eskiden yeniye (ay başı datetime, buy_ratio, sell_ratio) demetleri
+    __slots__ = (
+        "name",
+        "symbol",
+        "price",
+        "market_cap",
+        "volume_24h",
+        "potential",
+        "popularity",
+        "buy_ratio_1m",
+        "sell_ratio_1m",
+        "change_2y",
+        "months",
+        "uptrend"
+    )
+
+    def __init__(self, name, symbol, price, market_cap, volume_24h, potential, popularity,
+                 buy_ratio_1m, sell_ratio_1m, change_2y, months=(), uptrend=False):
+        self.name = name
+        self.symbol = symbol
+        self.price = price
+        self.market_cap = market_cap
+        self.volume_24h = volume_24h
+        self.potential = potential
+        self.popularity = popularity
+        self.buy_ratio_1m = buy_ratio_1m
+        self.sell_ratio_1m = sell_ratio_1m
+        self.change_2y = change_2y
+        self.months = months
+        self.uptrend = uptrend
+
+    def __repr__(self):
+        return f"ScreenedCoin({self.symbol!r}, potential={self.potential!r}, change_2y={self.change_2y!r})"
@@ -0,0 +1,156 @@
+import hashlib
+import json
+import math
+import os
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit, parse_qsl
+
+from .fetch_engine import TokenBucket
+
+
+def fixture_key(url, params):
+    # Host bilgisi anahtara girmez; aynı fixture'lar canlı API yerine yerel sunucudan da bulunur.
+    # Sorgu parametreleri URL'den metin olarak geldiği için hepsi str'e çevrilir.
+    path = urlsplit(url).path
+    query = sorted((str(k), str(v)) for k, v in (params or {}).items())
+    return hashlib.sha256((path + "?" + json.dumps(query)).encode("utf-8")).hexdigest()
+
+
+def save_fixture(directory, url, params, body):
+    os.makedirs(directory, exist_ok=True)
+    path = os.path.join(directory, fixture_key(url, params) + ".json")
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({"url": url, "params": params, "body": body}, f)
+
+
+def load_fixture(directory, url, params):
+    path = os.path.join(directory, fixture_key(url, params) + ".json")
+    try:
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)["body"]
+    except (OSError, ValueError, KeyError):
+        return None
+
+
+class MockAPIServer:
+    # Kaydedilmiş fixture'ları yerel HTTP sunucusundan verir; gecikme ve hız sınırı (429 + Retry-After) ayarlanabilir.
+    # Fixture'lar mum deposu ve sembol indeksi kapalıyken kaydedilmelidir (store_path = None, index_path = None /
+    # --no-store --no-index): benchmark.py ikisi olmadan oynatır, depoyla kaydedilen kısa "limit=1" istekleri
+    # ve indeksle değişen semboller fixture'larda bulunmaz.
+    def __init__(self, fixture_dir, latency=0.0, per_second=None, per_minute=None, host="127.0.0.1", port=0):
+        self.fixture_dir = fixture_dir
+        self.latency = latency
+        self.buckets = []
+        if per_second:
+            self.buckets.append(TokenBucket(per_second, 1.0))
+        if per_minute:
+            self.buckets.append(TokenBucket(per_minute, 60.0))
+        self.lock = threading.Lock()
+        self.request_count = 0
+        self.rejected_count = 0
+        self.bytes_sent = 0
+        self.httpd = ThreadingHTTPServer((host, port), self._handler())
+        self.httpd.daemon_threads = True
+        self.thread = None
+
+    @property
+    def base_url(self):
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def _retry_after(self):
+        # 0 ise istek kabul edilir, değilse kaç saniye sonra tekrar denenmeli
+        with self.lock:
+            self.request_count += 1
+            now = time.monotonic()
+            for bucket in self.buckets:
+                bucket.refill(now)
+            wait = max([bucket.wait_time() for bucket in self.buckets] + [0])
+            if wait > 0:
+                self.rejected_count += 1
+                return wait
+            for bucket in self.buckets:
+                bucket.tokens -= 1
+            return 0
+
+    def _handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                wait = server._retry_after()
+                if wait:
+                    self._send(429, {"Response": "Error", "Message": "rate limit"},
+                               {"Retry-After": str(math.ceil(wait))})
+                    return
+                if server.latency:
+                    time.sleep(server.latency)
+                parts = urlsplit(self.path)
+                query = dict(parse_qsl(parts.query))
+                body = load_fixture(server.fixture_dir, parts.path, query)
+                if body is None:
+                    # Kaydı olmayan istekler gerçek API'nin "veri yok" yanıtlarını taklit eder. histoday için
+                    # mesaj birebir aynı olmalı, yoksa fetch_histoday bunu kota hatası sanıp bekleyerek tekrar dener.
+                    if parts.path.endswith("/coins/markets"):
+                        body = []
+                    elif parts.path.endswith("/histoday"):
+                        pair = query.get("fsym", "") + "-" + query.get("tsym", "")
+                        body = {"Response": "Error",
+                                "Message": f"cccagg_or_exchange market does not exist for this coin pair ({pair})"}
+                    else:
+                        body = {"Response": "Error", "Message": "no fixture for " + self.path}
+                self._send(200, body)
+
+            def _send(self, status, body, headers=None):
+                payload = json.dumps(body).encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(payload)))
+                for name, value in (headers or {}).items():
+                    self.send_header(name, value)
+                self.end_headers()
+                self.wfile.write(payload)
+                with server.lock:
+                    server.bytes_sent += len(payload)
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+    def start(self):
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self.thread.start()
+        return self.base_url
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+def use_server(base_url):
+    # pipeline'daki API adreslerini yerel sunucuya yönlendirir
+    from . import pipeline
+    pipeline.COINGECKO_API = base_url + "/api/v3"
+    pipeline.CRYPTOCOMPARE_API = base_url + "/data"
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Kaydedilmiş API yanıtlarını yerel HTTP sunucusundan ver")
+    parser.add_argument("fixtures", nargs="?", default="fixtures")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency", type=float, default=0.0, help="istek başına gecikme (saniye)")
+    parser.add_argument("--per-second", type=int, default=None)
+    parser.add_argument("--per-minute", type=int, default=None)
+    args = parser.parse_args()
+
+    server = MockAPIServer(args.fixtures, args.latency, args.per_second, args.per_minute, port=args.port)
+    print(f"Serving {args.fixtures} on {server.base_url}")
+    try:
+        server.httpd.serve_forever()
+    except KeyboardInterrupt:
+        server.stop()
@@ -0,0 +1,206 @@
+import ast
+import heapq
+import re
+from itertools import count
+
+# Alanlar, ne zaman bilindiklerine göre üç aşamaya ayrılır:
+# piyasa listesiyle gelenler, ortalama hacme bağlı popularity ve geçmiş (histoday) gerektirenler
+MARKET_FIELDS = {"name", "symbol", "price", "market_cap", "volume_24h", "potential"}
+POPULARITY_FIELDS = {"popularity"}
+HISTORY_FIELDS = {"buy_ratio_1m", "sell_ratio_1m", "change_2y", "uptrend"}
+FIELDS = MARKET_FIELDS | POPULARITY_FIELDS | HISTORY_FIELDS
+
+_ALLOWED_NODES = (
+    ast.Expression, ast.BoolOp, ast.And, ast.Or, ast.UnaryOp, ast.Not, ast.USub, ast.UAdd,
+    ast.BinOp, ast.Add, ast.Sub, ast.Mult, ast.Div,
+    ast.Compare, ast.Lt, ast.LtE, ast.Gt, ast.GtE, ast.Eq, ast.NotEq,
+    ast.Name, ast.Load, ast.Constant
+)
+
+
+def potential(coin):
+    return (coin['volume_24h'] / coin['market_cap']) * 100 if coin['market_cap'] != 0 else 0
+
+
+def popularity(coin, avg_volume):
+    return (coin['volume_24h'] / avg_volume) * 100 if avg_volume > 0 else 0
+
+
+class Ranked:
+    # Sınırlı yığın girdisi; "a < b" a'nın sıralamada b'den sonra geldiği anlamına gelir, eşitlikte önce gelen kazanır
+    __slots__ = ("value", "seq", "item", "descending")
+
+    def __init__(self, value, seq, item, descending):
+        self.value = value
+        self.seq = seq
+        self.item = item
+        self.descending = descending
+
+    def __lt__(self, other):
+        if self.value == other.value:
+            return self.seq > other.seq
+        return self.value < other.value if self.descending else self.value > other.value
+
+
+class TopK:
+    # Akan adaylardan en iyi `size` tanesini tutar: her ekleme O(log size), bellek O(size).
+    # items() sonucu sorted(..., key, reverse=descending)[:size] ile aynıdır (eşitlikte ilk gelen önde).
+    def __init__(self, size, key, descending=True):
+        self.size = size
+        self.key = key
+        self.descending = descending
+        self.heap = []
+        self.seq = count()
+
+    def __len__(self):
+        return len(self.heap)
+
+    def push(self, item):
+        entry = Ranked(self.key(item), next(self.seq), item, self.descending)
+        if len(self.heap) < self.size:
+            heapq.heappush(self.heap, entry)
+        elif self.heap and self.heap[0] < entry:
+            heapq.heapreplace(self.heap, entry)
+
+    def items(self):
+        return [entry.item for entry in sorted(self.heap, reverse=True)]
+
+
+def top(items, size, key, descending=True):
+    # size None ise hepsi sıralanır
+    if size is None:
+        return sorted(items, key=key, reverse=descending)
+    ranking = TopK(size, key, descending)
+    for item in items:
+        ranking.push(item)
+    return ranking.items()
+
+
+def ranked(items, key, descending=True):
+    # Öğeleri sıralama düzeninde tembel olarak verir: yığın O(n) kurulur, her öğe O(log n) ile çıkar;
+    # baştan birkaç öğe gerekiyorsa listenin tamamı sıralanmaz
+    heap = [Ranked(key(item), -seq, item, not descending) for seq, item in enumerate(items)]
+    heapq.heapify(heap)
+    while heap:
+        yield heapq.heappop(heap).item
+
+
+class Predicate:
+    # Tarama ifadesinin tek bir "and" parçası, ör. "potential > 20"
+    __slots__ = ("source", "node", "fields", "code")
+
+    def __init__(self, node, source):
+        self.source = source
+        self.node = node
+        self.fields = {n.id for n in ast.walk(node) if isinstance(n, ast.Name)}
+        self.code = compile(ast.Expression(node), "<screen>", "eval")
+
+    def __call__(self, row):
+        return bool(eval(self.code, {"__builtins__": {}}, row))
+
+
+def parse_where(text):
+    # Sadece karşılaştırma, and/or/not, dört işlem, alan adları ve sabitler kabul edilir
+    tree = ast.parse(text.strip(), mode="eval")
+    for node in ast.walk(tree):
+        if not isinstance(node, _ALLOWED_NODES):
+            raise ValueError(f"Unsupported syntax in screening spec: {type(node).__name__}")
+        if isinstance(node, ast.Name) and node.id not in FIELDS:
+            raise ValueError(f"Unknown field {node.id!r} in screening spec, expected one of {sorted(FIELDS)}")
+    body = tree.body
+    parts = body.values if isinstance(body, ast.BoolOp) and isinstance(body.op, ast.And) else [body]
+    return [Predicate(part, ast.get_source_segment(text.strip(), part)) for part in parts]
+
+
+class ScreeningSpec:
+    # Bildirimsel tarama: "price < 10 and potential > 20 and change_2y > 0 order by potential desc limit 20"
+    # Her "and" parçası kullandığı alanlara göre en erken aşamaya yerleştirilir, böylece geçmiş verisi
+    # sadece piyasa koşullarını geçen coinler için çekilir.
+    def __init__(self, where=None, order_by=None, descending=False, limit=None):
+        if order_by is not None and order_by not in FIELDS:
+            raise ValueError(f"Unknown order by field {order_by!r}")
+        self.where = where
+        self.order_by = order_by
+        self.descending = descending
+        self.limit = limit
+        self.market, self.popularity, self.history = [], [], []
+        for predicate in parse_where(where) if where else []:
+            if predicate.fields & HISTORY_FIELDS:
+                self.history.append(predicate)
+            elif predicate.fields & POPULARITY_FIELDS:
+                self.popularity.append(predicate)
+            else:
+                self.market.append(predicate)
+
+    @classmethod
+    def parse(cls, text):
+        limit = order_by = None
+        descending = False
+        match = re.search(r"\s*\blimit\s+(\d+)\s*$", text, re.IGNORECASE)
+        if match:
+            limit = int(match.group(1))
+            text = text[:match.start()]
+        match = re.search(r"\s*\border\s+by\s+(\w+)(?:\s+(asc|desc))?\s*$", text, re.IGNORECASE)
+        if match:
+            order_by = match.group(1)
+            descending = (match.group(2) or "").lower() == "desc"
+            text = text[:match.start()]
+        return cls(text.strip() or None, order_by, descending, limit)
+
+    @property
+    def orders_by_history(self):
+        return self.order_by in HISTORY_FIELDS
+
+    @property
+    def limit_before_history(self):
+        # Geçmiş koşulu yoksa ve sıralama piyasa alanına göreyse limit histoday isteklerinden önce uygulanır
+        return self.limit is not None and not self.history and not self.orders_by_history
+
+    def list_bounds(self, market_cap_min, volume_min):
+        # "market_cap >= X" / "volume_24h > X" gibi alt sınırlar piyasa listesi taramasına itilir;
+        # liste market_cap_desc sıralı olduğu için sayfalama erken biter. Koşulların kendisi yine değerlendirilir.
+        for predicate in self.market:
+            node = predicate.node
+            if not (isinstance(node, ast.Compare) and len(node.ops) == 1 and isinstance(node.left, ast.Name)
+                    and isinstance(node.comparators[0], ast.Constant)
+                    and isinstance(node.ops[0], (ast.Gt, ast.GtE))):
+                continue
+            value = node.comparators[0].value
+            if not isinstance(value, (int, float)):
+                continue
+            if node.left.id == "market_cap":
+                market_cap_min = max(market_cap_min, value)
+            elif node.left.id == "volume_24h":
+                volume_min = max(volume_min, value)
+        return market_cap_min, volume_min
+
+    def filter_market(self, coins):
+        # Piyasa ve popularity aşamaları; dönüş: (aday coinler, popularity için ortalama hacim).
+        # Ortalama hacim piyasa koşullarını geçen coinler üzerinden hesaplanır.
+        pairs = [(coin, dict(coin, potential=potential(coin))) for coin in coins]
+        pairs = [(coin, row) for coin, row in pairs if all(p(row) for p in self.market)]
+        avg_volume = sum(coin['volume_24h'] for coin, _ in pairs) / len(pairs) if pairs else 0
+        if self.popularity or self.order_by in POPULARITY_FIELDS:
+            for coin, row in pairs:
+                row['popularity'] = popularity(coin, avg_volume)
+            pairs = [(coin, row) for coin, row in pairs if all(p(row) for p in self.popularity)]
+        if self.order_by is not None and not self.orders_by_history:
+            pairs = top(pairs, self.limit if self.limit_before_history else None,
+                        key=lambda pair: pair[1][self.order_by], descending=self.descending)
+        elif self.limit_before_history:
+            pairs = pairs[:self.limit]
+        return [coin for coin, _ in pairs], avg_volume
+
+    def match_history(self, result):
+        row = {field: getattr(result, field) for field in FIELDS}
+        return all(p(row) for p in self.history)
+
+    def finish(self, results, histories):
+        # Geçmişe bağlı sıralama ve limit, sonuçlar ve geçmişler birlikte
+        pairs = list(zip(results, histories))
+        if self.orders_by_history:
+            pairs = top(pairs, self.limit, key=lambda pair: getattr(pair[0], self.order_by),
+                        descending=self.descending)
+        elif self.limit is not None:
+            pairs = pairs[:self.limit]
+        return [r for r, _ in pairs], [h for _, h in pairs]
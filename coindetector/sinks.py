@@ -0,0 +1,317 @@
+import csv
+import importlib
+import os
+import threading
+
+BASE_HEADERS = [
+    "Name",
+    "Symbol",
+    "Price($)",
+    "Market Cap($)",
+    "24h Volume($)",
+    "Potential(%)",
+    "Popularity(%)",
+    "1 Month Buy/Sell Ratio",
+    "2 Year Change(%)"
+]
+
+MONTH_HEADERS = [
+    "M1 Ratio",
+    "M2 Ratio",
+    "M3 Ratio",
+    "M4 Ratio",
+    "M5 Ratio",
+    "M6 Ratio",
+    "Trend"
+]
+
+
+def get_headers(monthly=False):
+    return BASE_HEADERS + MONTH_HEADERS if monthly else list(BASE_HEADERS)
+
+
+def get_excel_headers(monthly=False):
+    # Excel'de buy ve sell oranları ayrı sayısal sütunlardır
+    headers = BASE_HEADERS[:7] + ["1 Month Buy(%)", "1 Month Sell(%)", "2 Year Change(%)"]
+    if monthly:
+        for i in range(1, 7):
+            headers += [f"M{i} Month", f"M{i} Buy(%)", f"M{i} Sell(%)"]
+        headers.append("Trend")
+    return headers
+
+
+def color_if_over_100(value, text=None):
+    # Sayısal değere göre karar verilir, metin yeniden ayrıştırılmaz
+    if text is None:
+        text = f"%{round(value, 2)}"
+    if value > 100:
+        return f"\033[92m{text}\033[0m"
+    return text
+
+
+def month_label(dt):
+    return dt.strftime("%B")[:3]
+
+
+def month_cells(result):
+    # Ay verilerini yaz, eksik aylar için boş string ekle (en eski solda)
+    month_ratios = [f"{month_label(dt)}: %{round(br, 2)} buy / %{round(sr, 2)} sell"
+                    for dt, br, sr in result.months]
+    while len(month_ratios) < 6:
+        month_ratios.insert(0, "")
+    return month_ratios + ["Uptrend" if result.uptrend else ""]
+
+
+def plain_row(result, monthly=False, percent_sign=True):
+    # Renk kodu olmayan, sayısal değerler yuvarlanmış satır (CSV / renksiz konsol)
+    p = "%" if percent_sign else ""
+    row = [
+        result.name,
+        result.symbol,
+        result.price,
+        result.market_cap,
+        result.volume_24h,
+        round(result.potential, 2),
+        round(result.popularity, 2),
+        f"{p}{round(result.buy_ratio_1m, 2)} buy / {p}{round(result.sell_ratio_1m, 2)} sell",
+        round(result.change_2y, 2)
+    ]
+    if monthly:
+        row += month_cells(result)
+    return row
+
+
+def excel_row(result, monthly=False):
+    row = [
+        result.name,
+        result.symbol,
+        result.price,
+        result.market_cap,
+        result.volume_24h,
+        round(result.potential, 2),
+        round(result.popularity, 2),
+        round(result.buy_ratio_1m, 2),
+        round(result.sell_ratio_1m, 2),
+        round(result.change_2y, 2)
+    ]
+    if monthly:
+        # Eksik aylar boş hücre (en eski solda)
+        row += [None, None, None] * (6 - len(result.months))
+        for dt, br, sr in result.months:
+            row += [month_label(dt), round(br, 2), round(sr, 2)]
+        row.append("Uptrend" if result.uptrend else "")
+    return row
+
+
+def colored_row(result, monthly=False):
+    buy = result.buy_ratio_1m
+    sell = result.sell_ratio_1m
+    row = [
+        result.name,
+        result.symbol,
+        result.price,
+        result.market_cap,
+        result.volume_24h,
+        color_if_over_100(result.potential),
+        color_if_over_100(result.popularity),
+        color_if_over_100(buy, f"%{round(buy, 2)} buy") + " / " + color_if_over_100(sell, f"%{round(sell, 2)} sell"),
+        color_if_over_100(result.change_2y)
+    ]
+    if monthly:
+        row += month_cells(result)
+    return row
+
+
+STREAM_WIDTHS = [18, 8, 12, 16, 16, 12, 13, 30, 16]
+STREAM_MONTH_WIDTH = 31
+STREAM_TREND_WIDTH = 7
+STREAM_NUMERIC = (2, 3, 4)  # sağa yaslanan sütunlar
+
+
+def stream_widths(monthly=False):
+    widths = list(STREAM_WIDTHS)
+    if monthly:
+        widths += [STREAM_MONTH_WIDTH] * 6 + [STREAM_TREND_WIDTH]
+    return widths
+
+
+def fit(text, width, right=False):
+    text = str(text)
+    if len(text) > width:
+        return text[:width - 1] + "…"
+    return text.rjust(width) if right else text.ljust(width)
+
+
+def stream_header(monthly=False):
+    widths = stream_widths(monthly)
+    line = " ".join(fit(h, w) for h, w in zip(get_headers(monthly), widths))
+    return line + "\n" + "─" * len(line)
+
+
+def stream_row(result, monthly=False, color=True):
+    # Sabit genişlikli satır; renk kodları görünür genişliği bozmasın diye hücre önce hizalanır, sonra renklendirilir
+    buy = result.buy_ratio_1m
+    sell = result.sell_ratio_1m
+    buy_text = f"%{round(buy, 2)} buy"
+    sell_text = f"%{round(sell, 2)} sell"
+    cells = [
+        result.name,
+        result.symbol,
+        f"{result.price:.6g}",
+        f"{result.market_cap:.0f}",
+        f"{result.volume_24h:.0f}",
+        f"%{round(result.potential, 2)}",
+        f"%{round(result.popularity, 2)}",
+        f"{buy_text} / {sell_text}",
+        f"%{round(result.change_2y, 2)}"
+    ]
+    if monthly:
+        cells += month_cells(result)
+    widths = stream_widths(monthly)
+    texts = [fit(cell, width, i in STREAM_NUMERIC) for i, (cell, width) in enumerate(zip(cells, widths))]
+    if color:
+        texts[5] = color_if_over_100(result.potential, texts[5])
+        texts[6] = color_if_over_100(result.popularity, texts[6])
+        if len(cells[7]) <= widths[7]:
+            texts[7] = color_if_over_100(buy, buy_text) + " / " + color_if_over_100(sell, sell_text) + \
+                " " * (widths[7] - len(cells[7]))
+        texts[8] = color_if_over_100(result.change_2y, texts[8])
+    return " ".join(texts)
+
+
+class ConsoleSink:
+    def __init__(self, monthly=False, color=True):
+        self.monthly = monthly
+        self.color = color
+
+    def write(self, results):
+        from tabulate import tabulate
+        if self.color:
+            rows = [colored_row(r, self.monthly) for r in results]
+        else:
+            rows = [plain_row(r, self.monthly) for r in results]
+        print(tabulate(rows, headers=get_headers(self.monthly), tablefmt="fancy_grid"))
+
+    def close(self):
+        pass
+
+
+class StreamingConsoleSink:
+    # Her coinin satırı metrikleri hazır olur olmaz (tamamlanma sırasıyla) yazılır. summary=True ise sonunda
+    # tüm sonuçlar sıralı tablo olarak tekrar basılır; sort_by verilirse o alana göre büyükten küçüğe.
+    def __init__(self, monthly=False, color=True, summary=True, sort_by=None):
+        self.monthly = monthly
+        self.color = color
+        self.summary = summary
+        self.sort_by = sort_by
+        self.lock = threading.Lock()
+        self.started = False
+
+    def add(self, result):
+        # Geçmiş çeken iş parçacıklarından çağrılır
+        line = stream_row(result, self.monthly, self.color)
+        with self.lock:
+            if not self.started:
+                print(stream_header(self.monthly))
+                self.started = True
+            print(line, flush=True)
+
+    def write(self, results):
+        if not self.summary:
+            return
+        if self.sort_by:
+            results = sorted(results, key=lambda r: getattr(r, self.sort_by), reverse=True)
+        print()
+        ConsoleSink(self.monthly, self.color).write(results)
+
+    def close(self):
+        pass
+
+
+class CsvSink:
+    def __init__(self, path="results.csv", monthly=False):
+        self.path = path
+        self.monthly = monthly
+
+    def write(self, results):
+        # CSV'ye renk kodları dahil etmiyoruz
+        with open(self.path, "w", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f)
+            writer.writerow(get_headers(self.monthly))
+            writer.writerows(plain_row(r, self.monthly, percent_sign=False) for r in results)
+
+    def close(self):
+        print(f"Data saved to {self.path}")
+
+
+class XlsxSink:
+    # openpyxl write-only modunda satırları akış olarak yazar; renklendirme hücre bazında değil,
+    # çalışma sayfası koşullu biçimlendirme kurallarıyla yapılır (>100 yeşil, "Uptrend" kırmızı)
+    def __init__(self, path="results.xlsx", monthly=False, open_file=True):
+        self.path = path
+        self.monthly = monthly
+        self.open_file = open_file
+
+    def write(self, results):
+        from openpyxl import Workbook
+        from openpyxl.formatting.rule import CellIsRule
+        from openpyxl.styles import PatternFill
+        from openpyxl.utils import get_column_letter
+
+        wb = Workbook(write_only=True)
+        ws = wb.create_sheet("Results")
+        ws.append(get_excel_headers(self.monthly))
+
+        last_row = 1
+        for r in results:
+            ws.append(excel_row(r, self.monthly))
+            last_row += 1
+
+        if last_row > 1:
+            green_fill = PatternFill(start_color="90EE90", end_color="90EE90", fill_type="solid")
+            red_fill = PatternFill(start_color="FF6347", end_color="FF6347", fill_type="solid")
+
+            # Potential, Popularity, 1 Month Buy, 1 Month Sell, 2 Year Change (F:J)
+            ws.conditional_formatting.add(
+                f"F2:J{last_row}",
+                CellIsRule(operator="greaterThan", formula=["100"], fill=green_fill)
+            )
+            if self.monthly:
+                trend_col = get_column_letter(len(get_excel_headers(self.monthly)))
+                ws.conditional_formatting.add(
+                    f"{trend_col}2:{trend_col}{last_row}",
+                    CellIsRule(operator="equal", formula=['"Uptrend"'], fill=red_fill)
+                )
+
+        wb.save(self.path)
+
+    def close(self):
+        print(f"Data saved to {self.path}")
+        if self.open_file:
+            os.startfile(self.path)
+
+
+SINKS = {
+    "console": ConsoleSink,
+    "stream": StreamingConsoleSink,
+    "csv": CsvSink,
+    "xlsx": XlsxSink,
+    # Sütunlu çıktılar pyarrow gerektirir, modülleri sadece seçildiklerinde yüklenir
+    "arrow": "columnar:ArrowSink",
+    "parquet": "columnar:ParquetSink"
+}
+
+
+def sink_class(name):
+    sink = SINKS[name]
+    if isinstance(sink, str):
+        module, cls = sink.split(":")
+        sink = getattr(importlib.import_module("." + module, __package__), cls)
+    return sink
+
+
+def make_sinks(names, monthly=False, options=None):
+    # Kullanıcının seçtiği çıktıların birleşimi, ör. ["console", "csv", "xlsx"]
+    # options: çıktı adına göre ek parametreler, ör. {"xlsx": {"open_file": False}}
+    options = options or {}
+    return [sink_class(name)(monthly=monthly, **options.get(name, {})) for name in names]
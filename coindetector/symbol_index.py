@@ -0,0 +1,144 @@
+import json
+import os
+import re
+import time
+from collections import defaultdict
+
+DAY = 86400
+MAX_AGE = DAY  # Sağlayıcıların coin listeleri günde bir kez yeniden indirilir
+NEGATIVE_TTL = 7 * DAY  # histoday'in "veri yok" dediği coinler bu süre boyunca istenmez
+
+
+def normalize_name(name):
+    return re.sub(r"[^a-z0-9]", "", (name or "").lower())
+
+
+def cryptocompare_name(key, info):
+    # summary=true listesinde sadece FullName vardır: "Bitcoin (BTC)"
+    name = info.get("CoinName")
+    if not name:
+        name = re.sub(r"\s*\([^)]*\)\s*$", "", info.get("FullName") or "")
+    return name or key
+
+
+class SymbolIndex:
+    # CoinGecko id -> CryptoCompare sembolü eşlemesi, JSON dosyasında saklanır.
+    # symbols: eşleşen coinler, ambiguous: aynı sembolü paylaşan ve isimden ayırt edilemeyen coinler (piyasa
+    # listesinde ilk görülen, yani piyasa değeri en yüksek olan alır), unsupported: CryptoCompare'de olmayanlar
+    # ve histoday'in veri vermediği coinler (id -> son geçerlilik zamanı). overrides elle verilen eşlemelerdir,
+    # değer None ise coin hiç istenmez.
+    def __init__(self, path="symbol_index.json", overrides=None):
+        self.path = path
+        self.overrides = overrides or {}
+        self.built = 0
+        self.symbols = {}
+        self.ambiguous = {}
+        self.unsupported = {}
+        self.dirty = False
+        if path and os.path.exists(path):
+            try:
+                with open(path, encoding="utf-8") as f:
+                    raw = json.load(f)
+            except (OSError, ValueError):
+                raw = {}
+            self.built = raw.get("built", 0)
+            self.symbols = raw.get("symbols", {})
+            self.ambiguous = raw.get("ambiguous", {})
+            self.unsupported = raw.get("unsupported", {})
+
+    def is_stale(self, now=None):
+        now = time.time() if now is None else now
+        return now - self.built >= MAX_AGE
+
+    def rebuild(self, coingecko_coins, cryptocompare_coins, now=None):
+        # coingecko_coins: /coins/list satırları, cryptocompare_coins: /all/coinlist "Data" sözlüğü.
+        # CryptoCompare aynı sembolü paylaşan coinleri "HOT*" gibi yıldızlı anahtarlarla ayırır.
+        now = time.time() if now is None else now
+        candidates = defaultdict(list)  # sembol -> [(CryptoCompare anahtarı, normalize isim)]
+        for key, info in cryptocompare_coins.items():
+            candidates[key.upper().rstrip("*")].append((key, normalize_name(cryptocompare_name(key, info))))
+        groups = defaultdict(list)  # sembol -> [(CoinGecko id, normalize isim)]
+        for coin in coingecko_coins:
+            if coin.get("id") and coin.get("symbol"):
+                groups[coin["symbol"].upper()].append((coin["id"], normalize_name(coin.get("name"))))
+
+        symbols, ambiguous, unsupported = {}, {}, {}
+        for symbol, coins in groups.items():
+            remaining = list(candidates.get(symbol, []))
+            unmatched = []
+            for coin_id, name in coins:
+                match = next((c for c in remaining if c[1] == name), None)
+                if match is None:
+                    unmatched.append(coin_id)
+                else:
+                    symbols[coin_id] = match[0]
+                    remaining.remove(match)
+            for coin_id in unmatched:
+                if len(remaining) == 1 and len(unmatched) == 1:
+                    # İsimler farklı yazılmış ama iki tarafta da tek aday var
+                    symbols[coin_id] = remaining[0][0]
+                elif len(remaining) == 1:
+                    ambiguous[coin_id] = remaining[0][0]
+                else:
+                    unsupported[coin_id] = now + MAX_AGE
+
+        # Çalışma sırasında öğrenilen ve henüz süresi dolmamış "veri yok" kayıtları korunur
+        for coin_id, expires in self.unsupported.items():
+            if expires > now and coin_id not in unsupported:
+                unsupported[coin_id] = expires
+        self.built = now
+        self.symbols, self.ambiguous, self.unsupported = symbols, ambiguous, unsupported
+        self.dirty = True
+
+    def lookup(self, coin_id, symbol, now=None):
+        # CryptoCompare sembolü veya desteklenmiyorsa None; indekste olmayan (yeni listelenmiş) coinler için
+        # CoinGecko sembolü denenir
+        if coin_id in self.overrides:
+            return self.overrides[coin_id]
+        now = time.time() if now is None else now
+        if self.unsupported.get(coin_id, 0) > now:
+            return None
+        return self.symbols.get(coin_id) or self.ambiguous.get(coin_id) or symbol.upper()
+
+    def resolve(self, coins, now=None):
+        # Piyasa listesindeki coinlere "fsym" ekler, desteklenmeyenleri çıkarır.
+        # Liste market_cap_desc sıralı olduğundan belirsiz bir sembolü ilk gelen (en büyük) coin alır.
+        claimed = set()
+        resolved = []
+        for coin in coins:
+            fsym = self.lookup(coin['id'], coin['symbol'], now)
+            if fsym is None:
+                continue
+            if coin['id'] in self.ambiguous and coin['id'] not in self.overrides:
+                if fsym in claimed:
+                    continue
+                claimed.add(fsym)
+            resolved.append(dict(coin, fsym=fsym))
+        return resolved
+
+    def mark_unsupported(self, coin_id, now=None):
+        now = time.time() if now is None else now
+        self.unsupported[coin_id] = now + NEGATIVE_TTL
+        self.dirty = True
+
+    def save(self):
+        if not self.path or not self.dirty:
+            return
+        tmp = self.path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump({
+                "built": self.built,
+                "symbols": self.symbols,
+                "ambiguous": self.ambiguous,
+                "unsupported": self.unsupported
+            }, f)
+        os.replace(tmp, self.path)
+        self.dirty = False
+
+
+def load_overrides(path):
+    # {"coingecko-id": "CCSYM"} veya desteklenmediğini bildirmek için {"coingecko-id": null}
+    if not path or not os.path.exists(path):
+        return {}
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
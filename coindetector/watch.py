@@ -0,0 +1,186 @@
+import time
+from datetime import datetime, timezone
+from itertools import islice
+
+from .pipeline import (CryptoCompareError, get_reliable_coins, fetch_histories, fetch_quotes, quoted_coin,
+                       drop_unsupported, history_metrics, build_results, open_symbol_index, refresh_symbol_index)
+from .ohlcv_store import OHLCVStore, DAY
+from .fetch_engine import RateLimiter, CRYPTOCOMPARE_PER_SECOND, CRYPTOCOMPARE_PER_MINUTE
+from .sinks import ConsoleSink
+
+top_count = 50  # Kaç coin alacağınızı belirleyin
+interval = 300  # Fiyatların yenilenme aralığı (saniye)
+market_interval = 3600  # Piyasa listesinin (CoinGecko) yenilenme aralığı; arada sadece anlık fiyatlar çekilir
+store_path = "ohlcv.db"  # Günlük mumların saklandığı yerel dosya
+index_path = "symbol_index.json"  # CoinGecko id -> CryptoCompare sembol indeksi, None ise semboller olduğu gibi kullanılır
+overrides_path = "symbol_overrides.json"  # Elle eşlemeler, ör. {"coingecko-id": "SYM"} ({"id": null} = hiç isteme)
+
+THRESHOLD = 100  # Bu eşiği geçen/altına inen değerler değişiklik olarak bildirilir
+WATCHED_FIELDS = ("potential", "popularity", "buy_ratio_1m", "sell_ratio_1m", "change_2y")
+
+
+class Watcher:
+    # Coin durumunu bellekte tutar. Piyasa listesi her turda, günlük mumlar ise UTC günü kapandığında yenilenir;
+    # geçmişe bağlı metrikler sadece yeni giren veya günü değişen coinler için yeniden hesaplanır.
+    def __init__(self, top_count=None, max_price=10.0, tsym="USD", store=None, concurrency=8, limiter=None,
+                 batch_mode=True, market_cap_min=1000000000, volume_min=50000000, index=None):
+        self.top_count = top_count
+        self.max_price = max_price
+        self.tsym = tsym
+        self.store = store
+        self.concurrency = concurrency
+        self.limiter = limiter
+        self.batch_mode = batch_mode
+        self.market_cap_min = market_cap_min
+        self.volume_min = volume_min
+        self.index = index  # SymbolIndex; coinlere "fsym" ekler, CryptoCompare'de olmayanları hiç istemez
+        self.metrics = {}  # symbol -> history_metrics satırı
+        self.metrics_day = {}  # symbol -> metriklerin hesaplandığı UTC günü
+        self.histories = {}  # symbol -> CoinHistory (bugünün mumu anlık fiyatla güncellenir)
+        self.coins = []  # son piyasa listesindeki (ucuz) coinler
+        self.results = {}  # symbol -> son ScreenedCoin
+
+    def refresh(self, now=None):
+        today = int(time.time() if now is None else now) // DAY * DAY
+
+        coins = get_reliable_coins(self.market_cap_min, self.volume_min, vs_currency=self.tsym.lower())
+        if self.top_count:
+            coins = islice(coins, self.top_count)
+        coins = [c for c in coins if c['price'] < self.max_price]
+        if self.index is not None:
+            refresh_symbol_index(self.index, now)
+            coins = self.index.resolve(coins, now)
+
+        # Sadece yeni giren coinlerin veya UTC günü kapandıktan sonra henüz yenilenmemiş coinlerin geçmişi çekilir
+        stale = [c for c in coins if self.metrics_day.get(c['symbol']) != today]
+        if stale:
+            histories = fetch_histories(stale, self.tsym, self.store, self.concurrency, self.limiter)
+            supported = drop_unsupported(stale, histories, self.index)
+            unsupported = {id(coin) for coin in stale} - {id(coin) for coin, _ in supported}
+            coins = [c for c in coins if id(c) not in unsupported]
+            histories = [history for _, history in supported]
+            for (coin, history), metrics in zip(supported, history_metrics(histories, self.batch_mode)):
+                self.histories[coin['symbol']] = history
+                self.metrics[coin['symbol']] = metrics
+                self.metrics_day[coin['symbol']] = today
+            if self.index is not None:
+                self.index.save()
+
+        # Listeden çıkan coinlerin durumu bırakılır
+        symbols = {c['symbol'] for c in coins}
+        for symbol in list(self.metrics):
+            if symbol not in symbols:
+                del self.metrics[symbol]
+                del self.metrics_day[symbol]
+                del self.histories[symbol]
+
+        self.coins = coins
+        return self._publish(coins)
+
+    def refresh_quotes(self, now=None):
+        # Gün içi hafif yenileme: piyasa listesi ve coin başına histoday yerine tüm semboller için birkaç
+        # pricemultifull isteği atılır. Bugünün yarım mumu güncellenir; potential, popularity, 1 aylık oran ve
+        # bu ayın oranı yeniden hesaplanır. Taranan coin kümesi bir sonraki refresh() çağrısına kadar sabit kalır.
+        today = int(time.time() if now is None else now) // DAY * DAY
+        if not self.coins or any(self.metrics_day.get(c['symbol']) != today for c in self.coins):
+            # UTC günü kapandı, kapanan mumlar için geçmiş yeniden çekilmeli
+            return self.refresh(now)
+
+        fsyms = {c['symbol']: c.get('fsym', c['symbol']) for c in self.coins}
+        quotes = fetch_quotes(list(fsyms.values()), self.tsym, self.limiter, now)
+        coins = [quoted_coin(c, quotes.get(fsyms[c['symbol']])) for c in self.coins]
+        updated = [c['symbol'] for c in coins if fsyms[c['symbol']] in quotes]
+        for symbol in updated:
+            self.histories[symbol].apply_candle(quotes[fsyms[symbol]]["candle"])
+        histories = [self.histories[symbol] for symbol in updated]
+        for symbol, metrics in zip(updated, history_metrics(histories, self.batch_mode)):
+            self.metrics[symbol] = metrics
+
+        self.coins = coins
+        return self._publish(coins)
+
+    def _publish(self, coins):
+        # Potential / popularity ortalama hacme bağlı ve ucuz, her turda hepsi için yeniden hesaplanır
+        results = build_results(coins, [self.metrics[c['symbol']] for c in coins])
+        changes = diff_results(self.results, results)
+        self.results = {r.symbol: r for r in results}
+        return results, changes
+
+
+def diff_results(old, new):
+    # Değişen satırlar: (symbol, alan, eski, yeni); eklenen/çıkan coinler için alan "added"/"removed"
+    changes = []
+    for r in new:
+        prev = old.get(r.symbol)
+        if prev is None:
+            changes.append((r.symbol, "added", None, None))
+            continue
+        if prev.uptrend != r.uptrend:
+            changes.append((r.symbol, "uptrend", prev.uptrend, r.uptrend))
+        for field in WATCHED_FIELDS:
+            before = getattr(prev, field)
+            after = getattr(r, field)
+            if (before > THRESHOLD) != (after > THRESHOLD):
+                changes.append((r.symbol, field, before, after))
+    new_symbols = {r.symbol for r in new}
+    for symbol in old:
+        if symbol not in new_symbols:
+            changes.append((symbol, "removed", None, None))
+    return changes
+
+
+def format_change(change):
+    symbol, field, before, after = change
+    if field in ("added", "removed"):
+        return f"{symbol}: {field}"
+    if field == "uptrend":
+        return f"{symbol}: Uptrend started" if after else f"{symbol}: Uptrend ended"
+    direction = "crossed above" if after > THRESHOLD else "dropped below"
+    return f"{symbol}: {field} {direction} %{THRESHOLD} (%{round(before, 2)} -> %{round(after, 2)})"
+
+
+def watch(sinks, interval=300, top_count=None, max_price=10.0, tsym="USD", store_path="ohlcv.db", concurrency=8,
+          rate_per_second=CRYPTOCOMPARE_PER_SECOND, rate_per_minute=CRYPTOCOMPARE_PER_MINUTE, batch_mode=True,
+          market_interval=None, market_cap_min=1000000000, volume_min=50000000, index_path="symbol_index.json",
+          overrides_path="symbol_overrides.json"):
+    # İlk turda tam tablo çıktılara yazılır, sonraki turlarda sadece değişen satırlar bildirilir.
+    # market_interval verilirse piyasa listesi o aralıkla, arada ise sadece anlık fiyatlar (refresh_quotes) yenilenir.
+    store = OHLCVStore(store_path) if store_path else None
+    index = open_symbol_index(index_path, overrides_path) if index_path else None
+    watcher = Watcher(top_count, max_price, tsym, store, concurrency,
+                      RateLimiter(rate_per_second, rate_per_minute), batch_mode, market_cap_min, volume_min, index)
+    first = True
+    last_market = None
+    try:
+        while True:
+            now = time.time()
+            try:
+                if market_interval and last_market is not None and now - last_market < market_interval:
+                    results, changes = watcher.refresh_quotes(now)
+                else:
+                    results, changes = watcher.refresh(now)
+                    last_market = now
+            except CryptoCompareError as e:
+                # Kota dolduysa bu tur atlanır, durum korunur ve bir sonraki turda tekrar denenir
+                print(f"{datetime.now(timezone.utc):%Y-%m-%d %H:%M:%S UTC} skipped: {e}")
+                time.sleep(interval)
+                continue
+            if first:
+                for sink in sinks:
+                    sink.write(results)
+                first = False
+            elif changes:
+                print(datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S UTC"))
+                for change in changes:
+                    print("  " + format_change(change))
+            time.sleep(interval)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        if store is not None:
+            store.close()
+
+
+if __name__ == "__main__":
+    watch([ConsoleSink(monthly=True)], interval=interval, top_count=top_count, store_path=store_path,
+          market_interval=market_interval, index_path=index_path, overrides_path=overrides_path)
@@ -0,0 +1,22 @@
+from coindetector.daily_ring import DailyRing
+from coindetector.ohlcv_store import DAY
+from coindetector.pipeline import CoinHistory, history_metrics
+
+
+def make_history(rows):
+    return CoinHistory.from_ring("AAA", "USD", DailyRing.from_rows(rows, 731))
+
+
+def test_missing_days_are_ignored_by_both_compute_paths():
+    # Eksik günler halka tamponda NaN satır olur; toplu ve coin başına hesaplama bunları yatay saymamalı
+    last_day = 20400
+    closes = [2.0, 0.5, 1.0, 2.0, 2.0, 0.5, 1.0]
+    rows = [{"time": day * DAY, "open": 1.0, "close": closes[day % len(closes)]}
+            for day in range(last_day - 200, last_day + 1) if day not in (last_day - 5, last_day - 9)]
+    history = make_history(rows)
+
+    batch = history_metrics([history], batch_mode=True)
+    per_coin = history_metrics([history], batch_mode=False)
+
+    assert len(history.ring) == 201
+    assert repr(batch) == repr(per_coin)
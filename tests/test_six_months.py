@@ -0,0 +1,38 @@
+import random
+from datetime import datetime, timezone
+
+from coindetector.daily_ring import DailyRing
+from coindetector.ohlcv_store import DAY, OHLCVStore
+from coindetector.pipeline import CoinHistory, get_6_months_data
+
+
+def make_rows(last_day, n_days, seed=1):
+    # Rastgele yükselen/düşen/yatay günler; Temmuz'un ilk üç günü hep yükselen, böylece ayın tamamını saymak
+    # oranı değiştirir
+    rnd = random.Random(seed)
+    rows = []
+    for day in range(last_day - n_days + 1, last_day + 1):
+        dt = datetime.fromtimestamp(day * DAY, timezone.utc)
+        open_ = 1.0
+        close = 2.0 if (dt.month == 7 and dt.day <= 3) else rnd.choice([0.5, 1.0, 2.0])
+        rows.append({"time": day * DAY, "open": open_, "high": 2.0, "low": 0.5, "close": close,
+                     "volumefrom": 1.0, "volumeto": 1.0})
+    return rows
+
+
+def make_history(rows, store=None):
+    return CoinHistory.from_ring("AAA", "USD", DailyRing.from_rows(rows, 731), store)
+
+
+def test_stored_months_clip_oldest_month_to_window():
+    # 2025-12-31'de 181 günlük pencere 4 Temmuz'da başlar; Temmuz depodaki sayaçlardan tam ay olarak sayılmamalı
+    last_day = int(datetime(2025, 12, 31, tzinfo=timezone.utc).timestamp()) // DAY
+    rows = make_rows(last_day, 731)
+    store = OHLCVStore(":memory:")
+    store.save("AAA", "USD", rows)
+
+    with_store = get_6_months_data(make_history(rows, store))
+    without_store = get_6_months_data(make_history(rows))
+
+    assert [dt for dt, _, _, _ in with_store][0] == datetime(2025, 7, 1)
+    assert with_store == without_store
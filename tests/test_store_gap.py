@@ -0,0 +1,34 @@
+import numpy as np
+
+from coindetector import pipeline
+from coindetector.ohlcv_store import DAY, OHLCVStore
+from coindetector.pipeline import CoinHistory
+
+
+def test_probe_window_does_not_leave_a_gap_in_the_store(monkeypatch):
+    # Gün 0'da tam geçmiş, gün 100'de 30 günlük sıralama yoklaması, gün 101'de tekrar tam geçmiş:
+    # aradaki 69 gün depoda yok, artımlı "limit=1" isteği yerine pencere yeniden indirilmeli
+    now = [20000 * DAY]
+    requests = []
+
+    def fake_get_json(url, params=None, **kwargs):
+        requests.append(dict(params))
+        to_ts = params.get("toTs", now[0] // DAY * DAY)
+        limit = params["limit"]
+        rows = [{"time": to_ts - (limit - i) * DAY, "open": 1.0, "close": 2.0} for i in range(limit + 1)]
+        return {"Response": "Success", "Data": {"Data": rows}}
+
+    monkeypatch.setattr(pipeline, "get_json", fake_get_json)
+    monkeypatch.setattr(pipeline.time, "time", lambda: now[0])
+    store = OHLCVStore(":memory:")
+
+    CoinHistory("AAA", "USD", 730, store)
+    now[0] += 100 * DAY
+    CoinHistory("AAA", "USD", 30, store)
+    now[0] += DAY
+    requests.clear()
+    history = CoinHistory("AAA", "USD", 730, store)
+
+    assert [r["limit"] for r in requests] == [730]
+    assert len(history) == 731
+    assert not np.isnan(history.ring.column("close")).any()